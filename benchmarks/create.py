@@ -0,0 +1,245 @@
+"""
+End-to-end benchmark for `reactango create`, runnable fully offline.
+
+Builds a local bare template repository of configurable size, puts stand-ins for
+python3 (venv creation), pip, node and pnpm with controllable latency on PATH,
+then times create_project() end to end and per phase over repeated runs.
+Results are reported as median/p95 and can be saved as, or compared against,
+a baseline JSON file. Exits with status 1 when a phase regressed by more than
+the threshold.
+
+Usage:
+    python benchmarks/create.py --runs 5 --save-baseline benchmarks/baseline.json
+    python benchmarks/create.py --runs 5 --baseline benchmarks/baseline.json --threshold 0.25
+
+The stand-ins are shell scripts, so the benchmark needs a POSIX system with git.
+"""
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from reactango_cli import cli  # noqa: E402
+
+# Phases faster than this are too noisy to flag as regressions.
+MIN_REGRESSION_SECONDS = 0.05
+
+PYTHON_SHIM = """#!/bin/sh
+# Stand-in for python3: fakes 'python3 -m venv DIR', runs anything else for real.
+if [ "$1" = "-m" ] && [ "$2" = "venv" ]; then
+    sleep "${REACTANGO_BENCH_VENV_LATENCY:-0}"
+    mkdir -p "$3/bin"
+    ln -sf "$REACTANGO_BENCH_REAL_PYTHON" "$3/bin/python"
+    cp "$REACTANGO_BENCH_SHIM_DIR/pip3" "$3/bin/pip3"
+    exit 0
+fi
+exec "$REACTANGO_BENCH_REAL_PYTHON" "$@"
+"""
+
+LATENCY_SHIM = """#!/bin/sh
+# Stand-in for {tool}: prints a little progress and waits instead of installing anything.
+if [ "$1" = "--version" ]; then
+    echo "{tool} 9.0.0"
+    exit 0
+fi
+echo "{tool} $*"
+sleep "${{{latency_variable}:-0}}"
+echo "{tool} done"
+"""
+
+NODE_SHIM = """#!/bin/sh
+echo "v20.0.0"
+"""
+
+def build_template_repository(work_dir: Path, file_count: int, file_size: int) -> Path:
+    """Creates a bare git repository that looks like the ReactTango template, with file_count extra files."""
+    source_dir = work_dir / "template-src"
+    (source_dir / "app").mkdir(parents=True)
+    (source_dir / "package.json").write_text(json.dumps({"name": "bench-template", "private": True}, indent=2))
+    (source_dir / "pnpm-lock.yaml").write_text("lockfileVersion: '9.0'\n")
+    (source_dir / "requirements.txt").write_text("django\n")
+    (source_dir / "manage.py").write_text("print('manage')\n")
+    filler = (("x" * 79) + "\n") * max(1, file_size // 80)
+    for index in range(file_count):
+        sub_dir = source_dir / "app" / f"module_{index // 100:03d}"
+        sub_dir.mkdir(exist_ok=True)
+        (sub_dir / f"file_{index:05d}.ts").write_text(f"// file {index}\n{filler}")
+
+    git = ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.invalid"]
+    subprocess.run(git + ["init", "--quiet", str(source_dir)], check=True)
+    subprocess.run(git + ["-C", str(source_dir), "add", "."], check=True)
+    subprocess.run(git + ["-C", str(source_dir), "commit", "--quiet", "-m", "template"], check=True)
+    bare_dir = work_dir / "template.git"
+    subprocess.run(["git", "clone", "--quiet", "--bare", str(source_dir), str(bare_dir)], check=True)
+    return bare_dir
+
+def install_shims(shim_dir: Path):
+    """Writes the python3/pip/node/pnpm stand-ins into shim_dir."""
+    shim_dir.mkdir(parents=True)
+    shims = {
+        "python3": PYTHON_SHIM,
+        "pip3": LATENCY_SHIM.format(tool="pip", latency_variable="REACTANGO_BENCH_PIP_LATENCY"),
+        "pip": LATENCY_SHIM.format(tool="pip", latency_variable="REACTANGO_BENCH_PIP_LATENCY"),
+        "pnpm": LATENCY_SHIM.format(tool="pnpm", latency_variable="REACTANGO_BENCH_PNPM_LATENCY"),
+        "node": NODE_SHIM,
+    }
+    for name, content in shims.items():
+        path = shim_dir / name
+        path.write_text(content)
+        path.chmod(0o755)
+
+def run_once(options, quiet=True):
+    """Runs create_project once and returns {phase name: seconds}, with 'total' for the whole run."""
+    cli.profiler.spans = []
+    cli.profiler.enabled = True
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+        if quiet:
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+            stack.enter_context(contextlib.redirect_stderr(devnull))
+        started_at = time.perf_counter()
+        installs_ok = cli.create_project(options)
+        total = time.perf_counter() - started_at
+    cli.profiler.enabled = False
+    if not installs_ok:
+        raise RuntimeError(f"Dependency installation failed for '{options.project_name}'.")
+
+    phases = {"total": total}
+    for span in cli.profiler.spans:
+        if span["category"] == "phase":
+            phases[span["name"]] = phases.get(span["name"], 0.0) + span["duration"]
+    return phases
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of values."""
+    ordered = sorted(values)
+    rank = max(1, int(round(fraction * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def summarize(samples):
+    """Turns a list of per-run phase dicts into {phase: {median, p95, runs}}."""
+    import statistics
+    names = sorted({name for sample in samples for name in sample})
+    summary = {}
+    for name in names:
+        values = [sample[name] for sample in samples if name in sample]
+        summary[name] = {
+            "median": round(statistics.median(values), 4),
+            "p95": round(percentile(values, 0.95), 4),
+            "runs": len(values),
+        }
+    return summary
+
+def compare_to_baseline(summary, baseline, threshold):
+    """Returns (rows, regressions), comparing medians phase by phase."""
+    rows = []
+    regressions = []
+    for name, stats in summary.items():
+        base = baseline.get("phases", {}).get(name)
+        if base is None:
+            rows.append((name, stats, None, None))
+            continue
+        change = (stats["median"] - base["median"]) / base["median"] if base["median"] > 0 else 0.0
+        rows.append((name, stats, base["median"], change))
+        if change > threshold and stats["median"] - base["median"] > MIN_REGRESSION_SECONDS:
+            regressions.append(name)
+    return rows, regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark 'reactango create' end to end against local stand-ins.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of measured runs (default: 5).")
+    parser.add_argument("--files", type=int, default=500, help="Number of extra files in the template (default: 500).")
+    parser.add_argument("--file-size", type=int, default=2048, help="Approximate size of each extra file in bytes (default: 2048).")
+    parser.add_argument("--pip-latency", type=float, default=0.3, help="Seconds the pip stand-in takes (default: 0.3).")
+    parser.add_argument("--pnpm-latency", type=float, default=0.3, help="Seconds the pnpm stand-in takes (default: 0.3).")
+    parser.add_argument("--venv-latency", type=float, default=0.1, help="Seconds the venv stand-in takes (default: 0.1).")
+    parser.add_argument("--parallel-install", action="store_true", help="Benchmark with --parallel-install.")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against.")
+    parser.add_argument("--save-baseline", help="Write the results to this baseline JSON file.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed median slowdown per phase as a fraction (default: 0.25).")
+    parser.add_argument("--verbose", action="store_true", help="Show the CLI output of every run.")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch directory for inspection.")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="reactango-bench-"))
+    saved_environ = dict(os.environ)
+    try:
+        template_repo = build_template_repository(work_dir, args.files, args.file_size)
+        shim_dir = work_dir / "shims"
+        install_shims(shim_dir)
+        os.environ.update({
+            "PATH": f"{shim_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "REACTANGO_CACHE_DIR": str(work_dir / "cache"),
+            "REACTANGO_BENCH_REAL_PYTHON": sys.executable,
+            "REACTANGO_BENCH_SHIM_DIR": str(shim_dir),
+            "REACTANGO_BENCH_PIP_LATENCY": str(args.pip_latency),
+            "REACTANGO_BENCH_PNPM_LATENCY": str(args.pnpm_latency),
+            "REACTANGO_BENCH_VENV_LATENCY": str(args.venv_latency),
+            "GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "bench@example.invalid",
+            "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "bench@example.invalid",
+        })
+
+        def options_for(run_name):
+            return cli.CreateOptions(
+                project_name=run_name,
+                directory=work_dir / "projects" / run_name,
+                template=template_repo.as_uri(),
+                init_git=True,
+                install="all",
+                use_venv_cache=False, # Measure the install itself, not the cache
+                parallel_install=args.parallel_install,
+                py_installer="pip",
+            )
+
+        # The first run fills the template cache so that every measured run starts from the same state.
+        run_once(options_for("warmup"), quiet=not args.verbose)
+        samples = []
+        for index in range(max(1, args.runs)):
+            samples.append(run_once(options_for(f"run-{index}"), quiet=not args.verbose))
+            print(f"run {index + 1}/{args.runs}: {samples[-1]['total']:.2f}s", file=sys.stderr)
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        if args.keep:
+            print(f"Scratch directory kept at {work_dir}", file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    summary = summarize(samples)
+    config = {key: getattr(args, key) for key in ("files", "file_size", "pip_latency", "pnpm_latency", "venv_latency", "parallel_install")}
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != config:
+            print(f"warning: baseline was recorded with different settings: {baseline.get('config')}", file=sys.stderr)
+    rows, regressions = compare_to_baseline(summary, baseline or {}, args.threshold)
+
+    print(f"\n{'PHASE':<28}{'MEDIAN':>10}{'P95':>10}{'BASELINE':>11}{'CHANGE':>9}")
+    for name, stats, base_median, change in sorted(rows, key=lambda row: -row[1]["median"]):
+        base_text = f"{base_median:.3f}s" if base_median is not None else "-"
+        change_text = f"{change:+.0%}" if change is not None else "-"
+        marker = "  REGRESSION" if name in regressions else ""
+        print(f"{name:<28}{stats['median']:>9.3f}s{stats['p95']:>9.3f}s{base_text:>11}{change_text:>9}{marker}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"config": config, "phases": summary}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if regressions:
+        print(f"\nFAIL: {len(regressions)} phase(s) slower than baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
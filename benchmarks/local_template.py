@@ -0,0 +1,97 @@
+"""
+Times how long 'reactango create --template DIR' takes to put a local template
+on disk, against a plain shutil.copytree of the same tree.
+
+Generates a template-like tree of small files, materializes it repeatedly into
+the same filesystem, and reports the median per method. Pass --immutable to
+mark the generated assets as immutable in the template manifest so that they
+are hardlinked. Exits with status 1 if a copy differs from the source.
+
+Usage:
+    python benchmarks/local_template.py --files 20000
+    python benchmarks/local_template.py --files 20000 --work-dir /mnt/btrfs/tmp   # on a reflink-capable filesystem
+"""
+import argparse
+import contextlib
+import filecmp
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from reactango_cli import cli  # noqa: E402
+
+def build_tree(root: Path, file_count: int, file_size: int, asset_count: int, immutable: bool):
+    """Writes file_count text files and asset_count 1 MB binary assets under root."""
+    filler = (("x" * 79) + "\n") * max(1, file_size // 80)
+    for index in range(file_count):
+        sub_dir = root / "app" / f"module_{index // 100:03d}"
+        sub_dir.mkdir(parents=True, exist_ok=True)
+        (sub_dir / f"file_{index:05d}.ts").write_text(f"// file {index}\n{filler}")
+    (root / "assets").mkdir()
+    for index in range(asset_count):
+        (root / "assets" / f"asset_{index}.bin").write_bytes(os.urandom(1_000_000))
+    if immutable:
+        (root / cli.TEMPLATE_MANIFEST_NAME).write_text(json.dumps({"immutable": ["assets/*"]}))
+
+def trees_match(left: Path, right: Path) -> bool:
+    """Compares file names and contents of two trees recursively."""
+    comparison = filecmp.dircmp(left, right)
+    if comparison.left_only or comparison.right_only or comparison.funny_files:
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(left, right, comparison.common_files, shallow=False)
+    if mismatch or errors:
+        return False
+    return all(trees_match(left / name, right / name) for name in comparison.common_dirs)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark copying a local template directory.")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per method (default: 3).")
+    parser.add_argument("--files", type=int, default=20000, help="Number of small text files (default: 20000).")
+    parser.add_argument("--file-size", type=int, default=2048, help="Approximate size of each text file in bytes (default: 2048).")
+    parser.add_argument("--assets", type=int, default=20, help="Number of 1 MB binary assets (default: 20).")
+    parser.add_argument("--immutable", action="store_true", help="Mark the assets immutable so they are hardlinked.")
+    parser.add_argument("--work-dir", help="Directory to run in; its filesystem decides whether reflinks are used.")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="reactango-local-bench-", dir=args.work_dir))
+    timings = {"copytree": [], "reactango": []}
+    try:
+        source = work_dir / "template"
+        build_tree(source, args.files, args.file_size, args.assets, args.immutable)
+        for run_index in range(max(1, args.runs)):
+            target = work_dir / f"copytree-{run_index}"
+            started_at = time.perf_counter()
+            shutil.copytree(source, target, symlinks=True)
+            timings["copytree"].append(time.perf_counter() - started_at)
+            shutil.rmtree(target)
+
+            target = work_dir / f"reactango-{run_index}"
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                started_at = time.perf_counter()
+                ok = cli.materialize_template_directory(source, target)
+                timings["reactango"].append(time.perf_counter() - started_at)
+            if not ok or not trees_match(source, target):
+                print(f"FAIL: {target} does not match the template.")
+                return 1
+            shutil.rmtree(target)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"{'METHOD':<12}{'MEDIAN':>10}{'MIN':>10}")
+    for method, values in timings.items():
+        print(f"{method:<12}{statistics.median(values):>9.3f}s{min(values):>9.3f}s")
+    copytree = statistics.median(timings["copytree"])
+    reactango = statistics.median(timings["reactango"])
+    print(f"\n{args.files + args.assets} files: {reactango:.3f}s ({copytree / reactango:.1f}x faster than copytree)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
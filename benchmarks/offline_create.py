@@ -0,0 +1,153 @@
+"""
+Checks that a second 'reactango create' from the same template does no network
+fetches: the template comes from the fresh local mirror, and pnpm installs from
+reactango's shared store without downloading anything.
+
+Reuses the local template repository and tool stand-ins of benchmarks/create.py,
+and additionally puts stand-ins on PATH that record every git, pnpm and npm
+invocation. Creates three projects:
+
+1. a first one, which fills the template mirror and the shared store;
+2. a second one, which must not run 'git fetch'/'git clone' and must run pnpm
+   with --prefer-offline and --store-dir <shared store>;
+3. one with --offline, which must run pnpm with --offline.
+
+No run may run 'pnpm fetch' or fall back to 'npm install -g pnpm'. The first
+run must clone the template, which shows that the git stand-in sees
+reactango's git calls. Exits with status 1 if any check fails.
+
+Usage:
+    python benchmarks/offline_create.py
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent))
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from reactango_cli import cli  # noqa: E402
+from create import build_template_repository, install_shims, run_once  # noqa: E402
+
+# Appends its arguments, one per line and followed by a blank line, to $REACTANGO_CHECK_LOG_DIR/<tool>.log.
+RECORDING_SHIM = """#!/bin/sh
+for argument in "$@"; do printf '%s\\n' "$argument"; done >> "$REACTANGO_CHECK_LOG_DIR/{tool}.log"
+echo >> "$REACTANGO_CHECK_LOG_DIR/{tool}.log"
+{body}
+"""
+
+# Commands that may contact a remote.
+NETWORK_GIT_COMMANDS = {"fetch", "clone", "ls-remote", "pull"}
+
+def install_recording_shims(shim_dir: Path, real_git: str):
+    """Replaces the git, pnpm and npm stand-ins with ones that record their arguments."""
+    bodies = {
+        "git": f'exec "{real_git}" "$@"',
+        "pnpm": 'if [ "$1" = "--version" ]; then echo "9.0.0"; fi',
+        "npm": 'if [ "$1" = "--version" ]; then echo "10.0.0"; else exit 1; fi',
+    }
+    for tool, body in bodies.items():
+        path = shim_dir / tool
+        path.write_text(RECORDING_SHIM.format(tool=tool, body=body))
+        path.chmod(0o755)
+
+def recorded_calls(log_dir: Path, tool: str):
+    """Returns the argument lists recorded for tool, leaving the log empty for the next run."""
+    log_path = log_dir / f"{tool}.log"
+    if not log_path.exists():
+        return []
+    calls = [block.split("\n") for block in log_path.read_text().split("\n\n") if block.strip()]
+    log_path.unlink()
+    return [[argument for argument in call if argument] for call in calls]
+
+def check_run(label, log_dir: Path, store_dir: Path, pnpm_mode: str, expect_git_fetch: bool):
+    """Returns a list of problems with the tool invocations recorded for one run."""
+    problems = []
+    git_calls = recorded_calls(log_dir, "git")
+    fetches = [call for call in git_calls if NETWORK_GIT_COMMANDS & set(call)]
+    if fetches and not expect_git_fetch:
+        problems.append(f"{label}: git contacted the remote: {fetches}")
+    elif expect_git_fetch and not fetches: # Otherwise the git checks of the later runs prove nothing
+        problems.append(f"{label}: no git fetch or clone was recorded; the git stand-in is not being used")
+    pnpm_calls = recorded_calls(log_dir, "pnpm")
+    pnpm_fetches = [call for call in pnpm_calls if call[:1] == ["fetch"]]
+    if pnpm_fetches:
+        problems.append(f"{label}: pnpm downloaded packages: {pnpm_fetches}")
+    installs = [call for call in pnpm_calls if call[:1] == ["install"]]
+    if len(installs) != 1:
+        problems.append(f"{label}: expected one 'pnpm install', got {installs}")
+    for call in installs:
+        if pnpm_mode not in call:
+            problems.append(f"{label}: 'pnpm install' ran without {pnpm_mode}: {call}")
+        if "--store-dir" not in call or call[call.index("--store-dir") + 1:][:1] != [str(store_dir)]:
+            problems.append(f"{label}: 'pnpm install' did not use the shared store {store_dir}: {call}")
+    npm_installs = [call for call in recorded_calls(log_dir, "npm") if "install" in call]
+    if npm_installs:
+        problems.append(f"{label}: npm was run to install pnpm: {npm_installs}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that a second 'reactango create' does no network fetches.")
+    parser.add_argument("--files", type=int, default=100, help="Number of extra files in the template (default: 100).")
+    parser.add_argument("--verbose", action="store_true", help="Show the CLI output of every run.")
+    args = parser.parse_args()
+
+    real_git = shutil.which("git")
+    if real_git is None:
+        print("FAIL: git is not installed.")
+        return 1
+    work_dir = Path(tempfile.mkdtemp(prefix="reactango-offline-check-"))
+    saved_environ = dict(os.environ)
+    problems = []
+    try:
+        template_repo = build_template_repository(work_dir, args.files, 2048)
+        shim_dir = work_dir / "shims"
+        install_shims(shim_dir)
+        install_recording_shims(shim_dir, real_git)
+        log_dir = work_dir / "calls"
+        log_dir.mkdir()
+        os.environ.update({
+            "PATH": f"{shim_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "REACTANGO_CACHE_DIR": str(work_dir / "cache"),
+            "REACTANGO_CHECK_LOG_DIR": str(log_dir),
+            "REACTANGO_BENCH_REAL_PYTHON": sys.executable,
+            "REACTANGO_BENCH_SHIM_DIR": str(shim_dir),
+            "GIT_AUTHOR_NAME": "check", "GIT_AUTHOR_EMAIL": "check@example.invalid",
+            "GIT_COMMITTER_NAME": "check", "GIT_COMMITTER_EMAIL": "check@example.invalid",
+        })
+        store_dir = cli.get_pnpm_store_dir()
+
+        def options_for(run_name, offline=False):
+            return cli.CreateOptions(
+                project_name=run_name,
+                directory=work_dir / "projects" / run_name,
+                template=template_repo.as_uri(),
+                offline=offline,
+                init_git=True,
+                install="frontend",
+            )
+
+        run_once(options_for("first"), quiet=not args.verbose)
+        problems += check_run("first create", log_dir, store_dir, "--prefer-offline", expect_git_fetch=True)
+        run_once(options_for("second"), quiet=not args.verbose)
+        problems += check_run("second create", log_dir, store_dir, "--prefer-offline", expect_git_fetch=False)
+        run_once(options_for("offline", offline=True), quiet=not args.verbose)
+        problems += check_run("create --offline", log_dir, store_dir, "--offline", expect_git_fetch=False)
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        return 1
+    print("OK: the second create and 'create --offline' fetched nothing and installed from the shared pnpm store.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Startup-time budget check for the reactango CLI.
+
+Imports reactango_cli.cli under `python -X importtime` a few times and fails when
+the median cumulative import time exceeds the budget, or when a module that must
+only be loaded lazily (the prompt libraries) is imported at startup.
+
+Usage: python benchmarks/startup.py [--runs 5] [--budget-ms 50]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Importing reactango_cli.cli must stay under this many milliseconds (median of --runs).
+STARTUP_BUDGET_MS = 50
+
+# Only imported once an interactive prompt is actually shown.
+LAZY_MODULES = ("questionary", "prompt_toolkit", "asyncio")
+
+def _benchmark_env():
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    env.pop("PYTHONDONTWRITEBYTECODE", None) # Let the warm-up run cache bytecode
+    return env
+
+def measure_import(python_executable):
+    """Returns (cumulative import time of reactango_cli.cli in ms, names of every module imported)."""
+    env = _benchmark_env()
+    result = subprocess.run(
+        [python_executable, "-X", "importtime", "-c", "import reactango_cli.cli"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, env=env, check=True
+    )
+    cli_import_ms = None
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        modules.add(name)
+        if name == "reactango_cli.cli" and cumulative_us.strip().isdigit():
+            cli_import_ms = int(cumulative_us) / 1000
+    if cli_import_ms is None:
+        raise RuntimeError("reactango_cli.cli did not show up in the -X importtime output.")
+    return cli_import_ms, modules
+
+def measure_version_command(python_executable):
+    """Returns the wall time of `reactango --version` in ms."""
+    env = _benchmark_env()
+    started_at = time.perf_counter()
+    subprocess.run([python_executable, "-m", "reactango_cli.cli", "--version"], stdout=subprocess.DEVNULL, env=env, check=True)
+    return (time.perf_counter() - started_at) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Check reactango's CLI startup time against its budget.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of measurements to take the median of (default: 5).")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS, help=f"Import time budget in ms (default: {STARTUP_BUDGET_MS}).")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to measure (default: the current one).")
+    args = parser.parse_args()
+
+    # Warm-up run so bytecode compilation isn't counted.
+    measure_import(args.python)
+    samples = []
+    lazy_violations = set()
+    for _ in range(max(1, args.runs)):
+        import_ms, modules = measure_import(args.python)
+        samples.append(import_ms)
+        lazy_violations |= {name for name in modules if name.split(".")[0] in LAZY_MODULES}
+    median_ms = statistics.median(samples)
+    version_ms = statistics.median(measure_version_command(args.python) for _ in range(max(1, args.runs)))
+
+    print(f"import reactango_cli.cli: median {median_ms:.1f} ms over {len(samples)} runs (budget {args.budget_ms:.0f} ms)")
+    print(f"reactango --version:      median {version_ms:.1f} ms wall time (includes interpreter startup)")
+
+    failed = False
+    if lazy_violations:
+        print(f"FAIL: imported at startup but must be lazy: {', '.join(sorted(lazy_violations))}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"FAIL: import time is over budget by {median_ms - args.budget_ms:.1f} ms")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Checks that 'reactango create' finishes when its output is a terminal.
+
+Some output paths are only taken on a TTY: the live progress line of
+--quiet-install and the direct passthrough of untagged steps. This script runs
+the CLI in a pseudo-terminal against the local template repository and tool
+stand-ins of benchmarks/create.py, once per combination of flags, and fails if
+a run hangs or exits with an error.
+
+Usage:
+    python benchmarks/tty_create.py
+    python benchmarks/tty_create.py --timeout 120
+
+Needs a POSIX system with git (for the pty module and the stand-ins).
+"""
+import argparse
+import os
+import pty
+import select
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from create import build_template_repository, install_shims  # noqa: E402
+
+# Each run creates a project with these extra flags; the default --jobs 4 lets steps overlap.
+FLAG_SETS = [
+    [],
+    ["--quiet-install"],
+    ["--quiet-install", "--parallel-install"],
+    ["--quiet-install", "--serial"],
+    ["--install-log"],
+]
+
+def run_in_pty(argv, cwd: Path, timeout: float):
+    """Runs argv with a pseudo-terminal as stdin/stdout/stderr. Returns (exit status or None on timeout, output)."""
+    pid, fd = pty.fork()
+    if pid == 0: # Child
+        try:
+            os.chdir(str(cwd))
+            os.execvp(argv[0], argv)
+        finally:
+            os._exit(127)
+    output = bytearray()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ready, _, _ = select.select([fd], [], [], 0.2)
+        if ready:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError: # EIO once the child has closed the terminal
+                chunk = b""
+            if not chunk:
+                break
+            output += chunk
+    else:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        os.close(fd)
+        return None, output.decode("utf-8", errors="replace")
+    _, status = os.waitpid(pid, 0)
+    os.close(fd)
+    return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1, output.decode("utf-8", errors="replace")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that 'reactango create' finishes on a terminal.")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds before a run counts as hung (default: 60).")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="reactango-tty-check-"))
+    saved_environ = dict(os.environ)
+    failures = []
+    try:
+        template_repo = build_template_repository(work_dir, 50, 2048)
+        shim_dir = work_dir / "shims"
+        install_shims(shim_dir)
+        os.environ.update({
+            "PATH": f"{shim_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "PYTHONPATH": str(REPO_ROOT),
+            "REACTANGO_CACHE_DIR": str(work_dir / "cache"),
+            "REACTANGO_BENCH_REAL_PYTHON": sys.executable,
+            "REACTANGO_BENCH_SHIM_DIR": str(shim_dir),
+            "REACTANGO_BENCH_PIP_LATENCY": "0.2",
+            "REACTANGO_BENCH_PNPM_LATENCY": "0.2",
+            "GIT_AUTHOR_NAME": "check", "GIT_AUTHOR_EMAIL": "check@example.invalid",
+            "GIT_COMMITTER_NAME": "check", "GIT_COMMITTER_EMAIL": "check@example.invalid",
+        })
+        for index, flags in enumerate(FLAG_SETS):
+            argv = [sys.executable, "-m", "reactango_cli.cli", "create", f"tty-{index}", "--template", template_repo.as_uri(),
+                    "--install-all", "--init-git", "--py-installer", "pip"] + flags
+            started_at = time.monotonic()
+            status, output = run_in_pty(argv, work_dir, args.timeout)
+            label = " ".join(flags) or "(default flags)"
+            if status is None:
+                failures.append(f"{label}: hung for {args.timeout:.0f}s; last output: {output[-300:]!r}")
+            elif status != 0:
+                failures.append(f"{label}: exited with status {status}; last output: {output[-300:]!r}")
+            else:
+                print(f"ok   {label} ({time.monotonic() - started_at:.1f}s)")
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
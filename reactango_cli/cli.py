@@ -1,11 +1,14 @@
 import argparse
+import errno
 import subprocess
 import sys
 import os
 import shutil
+import time
+import threading
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-import questionary
-from questionary import Style
+from typing import Callable, NamedTuple, Optional
 
 from . import __version__
 
@@ -40,25 +43,40 @@ class Colors:
     BG_BLUE = '\033[44m'
 
 # Enhanced color printing functions
+# With --output ndjson each of these becomes one event with its level instead; see enable_event_output().
 def print_error(message):
+    if event_sink is not None:
+        return event_sink.emit("message", "error", text=message)
     print(f"{Colors.BRIGHT_RED}{EMOJI_ERROR} {message}{Colors.RESET}")
 
 def print_warning(message):
+    if event_sink is not None:
+        return event_sink.emit("message", "warning", text=message)
     print(f"{Colors.BRIGHT_YELLOW}{EMOJI_WARNING} {message}{Colors.RESET}")
 
 def print_success(message):
+    if event_sink is not None:
+        return event_sink.emit("message", "success", text=message)
     print(f"{Colors.BRIGHT_GREEN}{EMOJI_SUCCESS} {message}{Colors.RESET}")
 
 def print_info(message):
+    if event_sink is not None:
+        return event_sink.emit("message", "info", text=message)
     print(f"{Colors.BRIGHT_CYAN}{EMOJI_INFO} {message}{Colors.RESET}")
 
 def print_step(message):
+    if event_sink is not None:
+        return event_sink.emit("message", "step", text=message)
     print(f"{Colors.BRIGHT_BLUE}{EMOJI_GEAR} {message}{Colors.RESET}")
 
 def print_party(message):
+    if event_sink is not None:
+        return event_sink.emit("message", "success", text=message)
     print(f"{Colors.BRIGHT_MAGENTA}{EMOJI_PARTY} {message}{Colors.RESET}")
 
 def print_rocket(message):
+    if event_sink is not None:
+        return event_sink.emit("message", "success", text=message)
     print(f"{Colors.BRIGHT_GREEN}{EMOJI_ROCKET} {message}{Colors.RESET}")
 
 EMOJI_ERROR = "❌"
@@ -86,8 +104,21 @@ EMOJI_ALL = "🎯"
 
 TEMPLATE_REPO_URL = "https://github.com/Abdullah6346/ReactTangoTemplate.git"
 
+# A cached template mirror younger than this many seconds is used without contacting the remote.
+TEMPLATE_CACHE_TTL = os.environ.get("REACTANGO_TEMPLATE_TTL", "600")
+DEFAULT_TEMPLATE_CACHE_TTL_SECONDS = 600
+
+def template_cache_ttl_seconds() -> int:
+    """Parses REACTANGO_TEMPLATE_TTL, falling back to the default with a warning if it isn't a number of seconds."""
+    try:
+        return int(TEMPLATE_CACHE_TTL)
+    except ValueError:
+        print_warning(f"Ignoring REACTANGO_TEMPLATE_TTL: '{TEMPLATE_CACHE_TTL}' is not a number of seconds. "
+                      f"Using {DEFAULT_TEMPLATE_CACHE_TTL_SECONDS}.")
+        return DEFAULT_TEMPLATE_CACHE_TTL_SECONDS
+
 # Custom questionary style
-custom_style = Style([
+CUSTOM_STYLE_RULES = [
     ('question', 'bold'),
     ('answer', 'fg:#ff9d00 bold'),
     ('pointer', 'fg:#ff9d00 bold'),
@@ -97,12 +128,456 @@ custom_style = Style([
     ('instruction', ''),
     ('text', ''),
     ('disabled', 'fg:#858585 italic')
-])
+]
+
+def load_questionary():
+    """
+    Imports questionary and returns (questionary, custom_style).
+    questionary pulls in prompt_toolkit, which dominates startup time, so it is
+    only imported right before an interactive prompt is shown.
+    Raises RuntimeError in ndjson mode, where a prompt would corrupt the event
+    stream; callers then fall back to their non-interactive default.
+    """
+    if event_sink is not None:
+        raise RuntimeError("interactive prompts are disabled with --output ndjson")
+    import questionary
+    return questionary, questionary.Style(CUSTOM_STYLE_RULES)
+
+# --- Prefixed Output for Concurrent Tasks ---
+_thread_output = threading.local()
+# Reentrant: ProgressLine holds it while writing to sys.stdout, which may be a PrefixedStream that takes it again.
+_output_lock = threading.RLock()
+
+def current_output_prefix():
+    """Returns the line prefix set for the calling thread, if any."""
+    return getattr(_thread_output, "prefix", None)
+
+class PrefixedStream:
+    """
+    Wraps a text stream so that whole lines written from a thread with an
+    output prefix are tagged with it, and lines from concurrent threads never interleave.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        self._pending = threading.local()
+
+    def write(self, text):
+        prefix = current_output_prefix()
+        if prefix is None:
+            with _output_lock:
+                return self._stream.write(text)
+        buffered = getattr(self._pending, "text", "") + text
+        lines = buffered.split("\n")
+        self._pending.text = lines.pop()
+        if lines:
+            with _output_lock:
+                for line in lines:
+                    self._stream.write(f"{prefix} {line}\n")
+                self._stream.flush()
+        return len(text)
+
+    def flush(self):
+        with _output_lock:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+@contextmanager
+def prefixed_output():
+    """Routes sys.stdout/sys.stderr through PrefixedStream for the duration of the block."""
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    if isinstance(original_stdout, (PrefixedStream, EventStream)): # Already tagging output; don't tag it twice
+        yield
+        return
+    sys.stdout, sys.stderr = PrefixedStream(original_stdout), PrefixedStream(original_stderr)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = original_stdout, original_stderr
+
+def run_with_output_prefix(prefix, func, *args, **kwargs):
+    """Calls func in the current thread with every output line tagged with prefix."""
+    previous_prefix = current_output_prefix()
+    _thread_output.prefix = prefix
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _thread_output.prefix = previous_prefix
+
+def run_in_phase(phase, func, *args, **kwargs):
+    """Calls func in the current thread with phase as what it is working on; see current_phase()."""
+    previous_phase = current_phase()
+    _thread_output.phase = phase
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _thread_output.phase = previous_phase
+
+# --- Structured Event Output ---
+class EventSink:
+    """
+    Writes events as newline-delimited JSON to a file descriptor, for programs
+    that drive reactango (--output ndjson). Each event is a single unbuffered
+    write, so events from concurrent steps and batch workers never interleave.
+    """
+    def __init__(self, fd: int):
+        self.fd = fd
+        self._lock = threading.Lock()
+
+    def emit(self, event, level="info", **payload):
+        import json
+        record = {
+            "ts": round(time.monotonic(), 6),
+            "event": event,
+            "level": level,
+            "phase": current_phase(),
+            "pid": os.getpid(),
+            "payload": payload,
+        }
+        data = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        with self._lock:
+            while data:
+                data = data[os.write(self.fd, data):]
+
+event_sink: Optional[EventSink] = None
+
+def current_phase() -> Optional[str]:
+    """
+    Names what the calling thread is working on, e.g. 'backend', or
+    'my-app/backend' in a batch. Set with run_in_phase(), independently of
+    whether the thread's output is tagged.
+    """
+    return getattr(_thread_output, "phase", None)
+
+class EventStream:
+    """
+    Replaces sys.stdout/sys.stderr in ndjson mode: every line printed outside
+    the print_* helpers becomes a 'message' event. Decoration (emoji, rules,
+    blank lines) is dropped.
+    """
+    encoding = "utf-8"
+
+    def __init__(self, sink: EventSink, level: str):
+        self._sink = sink
+        self._level = level
+        self._pending = threading.local()
+
+    def write(self, text):
+        import re
+        buffered = getattr(self._pending, "text", "") + text
+        lines = buffered.split("\n")
+        self._pending.text = lines.pop()
+        for line in lines:
+            plain = re.sub(r"^[^\w\"'(\[./~-]+", "", line).rstrip()
+            if re.search(r"\w", plain):
+                self._sink.emit("message", self._level, text=plain)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+def enable_event_output(fd=1):
+    """
+    Switches the process to ndjson output on fd: colours off, and every
+    message, phase and subprocess reported as an event. Nothing else is written to stdout.
+    """
+    global event_sink
+    for name in dir(Colors):
+        if name.isupper():
+            setattr(Colors, name, "")
+    sys.stdout.flush()
+    event_sink = EventSink(fd)
+    sys.stdout = EventStream(event_sink, "info")
+    sys.stderr = EventStream(event_sink, "error")
+
+# --- Timing Instrumentation ---
+class Profiler:
+    """
+    Collects timed spans for phases of a run and for every subprocess it starts.
+    Spans are only kept while enabled; they can be written as a Chrome trace
+    (chrome://tracing, Perfetto) or printed as a summary table.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def add_span(self, name, category, started_at, ended_at, **details):
+        if not self.enabled:
+            return
+        span = {
+            "name": name,
+            "category": category,
+            "start": started_at - self._origin,
+            "duration": ended_at - started_at,
+            "thread_id": threading.get_ident(),
+            "thread_name": threading.current_thread().name,
+            "details": details,
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    def chrome_trace(self) -> dict:
+        """Returns the spans as a Chrome trace event document."""
+        pid = os.getpid()
+        events = []
+        for thread_id, thread_name in sorted({(s["thread_id"], s["thread_name"]) for s in self.spans}):
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+        for span in sorted(self.spans, key=lambda s: s["start"]):
+            events.append({
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6),
+                "dur": round(span["duration"] * 1e6),
+                "pid": pid,
+                "tid": span["thread_id"],
+                "args": span["details"],
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        import json
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f, indent=1)
+
+    def print_summary(self):
+        """Prints every phase and subprocess in start order with its timings."""
+        if not self.spans:
+            return
+        print(f"\n{Colors.BOLD}{'SPAN':<58}{'WALL':>9}{'CPU':>9}{'PEAK RSS':>11}  EXIT{Colors.RESET}")
+        for span in sorted(self.spans, key=lambda s: s["start"]):
+            details = span["details"]
+            is_phase = span["category"] == "phase"
+            label = span["name"] if is_phase else f"  $ {span['name']}"
+            if len(label) > 56:
+                label = label[:53] + "..."
+            cpu = details.get("cpu_user_s", 0) + details.get("cpu_system_s", 0) if "cpu_user_s" in details else None
+            cpu_text = f"{cpu:.2f}s" if cpu is not None else "-"
+            rss_text = format_size(details["peak_rss_kb"] * 1024) if details.get("peak_rss_kb") else "-"
+            exit_text = str(details["exit_code"]) if "exit_code" in details else ""
+            style = Colors.BRIGHT_CYAN if is_phase else Colors.DIM
+            print(f"{style}{label:<58}{span['duration']:>8.2f}s{cpu_text:>9}{rss_text:>11}  {exit_text}{Colors.RESET}")
+
+profiler = Profiler()
+
+@contextmanager
+def profile_phase(name):
+    """Records the enclosed block as a phase span when profiling is enabled."""
+    started_at = time.perf_counter()
+    if event_sink is not None:
+        event_sink.emit("phase.start", name=name)
+    try:
+        yield
+    finally:
+        ended_at = time.perf_counter()
+        profiler.add_span(name, "phase", started_at, ended_at)
+        if event_sink is not None:
+            event_sink.emit("phase.end", name=name, duration=round(ended_at - started_at, 6))
+
+def wait_for_process(process):
+    """
+    Waits for process to exit and returns its resource usage, or None where it
+    is unavailable. The usage is only collected while profiling is enabled.
+    """
+    if not profiler.enabled or not hasattr(os, "wait4"):
+        process.wait()
+        return None
+    _, status, rusage = os.wait4(process.pid, 0)
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+    return rusage
+
+def record_process_start(command_list, process, cwd=None):
+    """Reports a subprocess that was just started, in ndjson mode."""
+    if event_sink is not None:
+        event_sink.emit("process.start", argv=[str(c) for c in command_list], cwd=str(cwd) if cwd else None, pid=process.pid)
+
+def record_process_span(command_list, started_at, returncode, rusage=None, pid=None, output_bytes=None):
+    """
+    Adds a subprocess span with the exit code and, when known, CPU time and peak RSS.
+    In ndjson mode it is also reported as a 'process.exit' event with the bytes
+    the process wrote per stream (output_bytes, e.g. {'stdout': 1024}).
+    """
+    if event_sink is not None:
+        event_sink.emit("process.exit", "info" if returncode == 0 else "error", argv=[str(c) for c in command_list],
+                        pid=pid, exit_code=returncode, duration=round(time.perf_counter() - started_at, 6),
+                        output_bytes=output_bytes or {})
+    details = {"command": [str(c) for c in command_list], "exit_code": returncode}
+    if rusage is not None:
+        details["cpu_user_s"] = round(rusage.ru_utime, 3)
+        details["cpu_system_s"] = round(rusage.ru_stime, 3)
+        # ru_maxrss is in kilobytes on Linux but in bytes on macOS.
+        details["peak_rss_kb"] = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    name = " ".join(str(c) for c in command_list)
+    profiler.add_span(name, "subprocess", started_at, time.perf_counter(), **details)
+
+# --- Streaming Command Output ---
+# Lines of output kept in memory per command for error reports.
+OUTPUT_TAIL_LINES = 40
+# Longer lines are split; this bounds memory even for output without newlines.
+MAX_OUTPUT_LINE_BYTES = 64 * 1024
+COMMAND_LOG_MAX_BYTES = 5 * 1024 * 1024
+COMMAND_LOG_BACKUPS = 3
+
+class RotatingCommandLog:
+    """
+    Appends the output of every command to a log file. Once the file grows past
+    max_bytes it is renamed to <name>.1 (shifting older files up to
+    <name>.<backup_count>) and a new file is started. The file is only created
+    once the first line is written.
+    """
+    def __init__(self, path: Path, max_bytes=COMMAND_LOG_MAX_BYTES, backup_count=COMMAND_LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _rotate(self):
+        self._file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backup_count > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = open(self.path, "a", encoding="utf-8", errors="replace")
+
+    def write_line(self, text):
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8", errors="replace")
+            self._file.write(text + "\n")
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+class CommandOutputSettings:
+    """How execute_command presents command output; see command_output_settings()."""
+    def __init__(self):
+        self.quiet = False
+        self.log = None
+
+command_output = CommandOutputSettings()
+
+@contextmanager
+def command_output_settings(log_path: Optional[Path] = None, quiet=False):
+    """
+    Within the block, commands tee their output to a rotating log at log_path,
+    and with quiet=True only show a live progress line instead of their full
+    output. The settings apply to every thread, including concurrent installs.
+    """
+    previous = (command_output.quiet, command_output.log)
+    log = RotatingCommandLog(log_path) if log_path else None
+    command_output.quiet, command_output.log = quiet, log
+    try:
+        yield log
+    finally:
+        command_output.quiet, command_output.log = previous
+        if log is not None:
+            log.close()
+
+class ProgressLine:
+    """Keeps a single terminal line updated with the latest output of a quiet command."""
+    def __init__(self, label):
+        self.enabled = sys.stdout.isatty() and current_output_prefix() is None
+        self.label = label
+        self._last_update = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, line):
+        now = time.monotonic()
+        if not self.enabled or now - self._last_update < 0.1:
+            return
+        self._last_update = now
+        width = shutil.get_terminal_size().columns - len(self.label) - 6
+        text = line.strip()[:max(width, 0)]
+        with self._lock, _output_lock:
+            sys.stdout.write(f"\r\033[K  {Colors.DIM}{self.label}: {text}{Colors.RESET}")
+            sys.stdout.flush()
+
+    def clear(self):
+        if self.enabled and self._last_update:
+            with _output_lock:
+                sys.stdout.write("\r\033[K")
+                sys.stdout.flush()
+
+def _stream_process_output(process, command_list, verbose_output):
+    """
+    Reads process's stdout and stderr concurrently until both are closed, then
+    waits for it. Every line is echoed (or shown on the progress line when not
+    verbose), teed to the active command log and kept in a bounded tail buffer.
+    Returns (tail lines, rusage, {stream name: bytes read}).
+    """
+    from collections import deque
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    log = command_output.log
+    progress = None if verbose_output else ProgressLine(Path(str(command_list[0])).name)
+    if log is not None:
+        log.write_line(f"$ {' '.join(str(c) for c in command_list)}  # {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    output_bytes = {"stdout": 0, "stderr": 0}
+
+    def pump(pipe, stream_name, echo_stream):
+        with pipe:
+            for chunk in iter(lambda: pipe.readline(MAX_OUTPUT_LINE_BYTES), b""):
+                output_bytes[stream_name] += len(chunk)
+                # Progress bars redraw with carriage returns; only the last state of the line matters.
+                line = chunk.decode("utf-8", errors="replace").rstrip("\r\n").rsplit("\r", 1)[-1]
+                tail.append(line)
+                if log is not None:
+                    log.write_line(line)
+                if verbose_output and event_sink is not None:
+                    event_sink.emit("process.output", "output", pid=process.pid, stream=stream_name, text=line)
+                elif verbose_output:
+                    print(line, file=echo_stream())
+                else:
+                    progress.update(line)
+
+    # stderr is drained on a helper thread so that neither pipe can fill up and stall the command.
+    stderr_thread = threading.Thread(target=run_in_phase, daemon=True,
+                                     args=(current_phase(), run_with_output_prefix, current_output_prefix(),
+                                           pump, process.stderr, "stderr", lambda: sys.stderr))
+    stderr_thread.start()
+    pump(process.stdout, "stdout", lambda: sys.stdout)
+    stderr_thread.join()
+    rusage = wait_for_process(process)
+    if progress is not None:
+        progress.clear()
+    if log is not None:
+        log.write_line(f"# exit code {process.returncode}")
+    return list(tail), rusage, output_bytes
 
 # --- Helper Functions ---
+# Resolved command paths, keyed on (PATH, name), so a run looks each tool up only once.
+_command_paths = {}
+
+def find_command(command_name) -> Optional[str]:
+    """Returns the full path of command_name on PATH, or None."""
+    key = (os.environ.get("PATH", ""), command_name)
+    if key not in _command_paths:
+        _command_paths[key] = shutil.which(command_name)
+    return _command_paths[key]
+
 def command_exists(command_name):
     """Checks if a command is available on the system."""
-    return shutil.which(command_name) is not None
+    return find_command(command_name) is not None
 
 def is_git_available():
     """Checks if the 'git' command is available on the system."""
@@ -111,25 +586,36 @@ def is_git_available():
 def execute_command(command_list, cwd=None, error_message="Command failed", verbose_output=True, check_return_code=True):
     """
     Executes a command, optionally streaming its output, and handles errors.
+    Output is read line by line as it is produced, so memory stays flat however
+    much the command prints; only the last OUTPUT_TAIL_LINES lines are kept for
+    the error report.
     Returns True on success, False on failure if check_return_code is True.
     """
     cmd_str = ' '.join(str(c) for c in command_list)
     print_step(f"Executing: {Colors.CYAN}{cmd_str}{Colors.RESET}" + (f" in {Colors.YELLOW}{cwd}{Colors.RESET}" if cwd else ""))
+    verbose_output = verbose_output and not command_output.quiet
+    started_at = time.perf_counter()
+    tail = None
+    output_bytes = None
     try:
-        process = subprocess.Popen(
-            command_list,
-            cwd=cwd,
-            stdout=sys.stdout if verbose_output else subprocess.PIPE,
-            stderr=sys.stderr if verbose_output else subprocess.PIPE,
-            text=True,
-            universal_newlines=True # Recommended for text mode
-        )
-        stdout, stderr = process.communicate() # Wait for command to complete
+        if verbose_output and current_output_prefix() is None and command_output.log is None and event_sink is None:
+            # Nothing to tag or tee: let the command write to the terminal directly and keep its colours and progress bars.
+            process = subprocess.Popen(command_list, cwd=cwd, stdout=sys.stdout, stderr=sys.stderr)
+            rusage = wait_for_process(process) # Wait for command to complete
+        else:
+            process = subprocess.Popen(command_list, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            record_process_start(command_list, process, cwd)
+            tail, rusage, output_bytes = _stream_process_output(process, command_list, verbose_output)
+        record_process_span(command_list, started_at, process.returncode, rusage, pid=process.pid, output_bytes=output_bytes)
 
         if check_return_code and process.returncode != 0:
             print_error(f"{error_message} (Exit code: {process.returncode})")
-            if not verbose_output and stderr: # Print stderr if it wasn't already streamed
-                print(f"Stderr: {stderr.strip()}")
+            if not verbose_output and tail: # Show the end of the output if it wasn't already streamed
+                print(f"{Colors.DIM}Last {len(tail)} lines of output:{Colors.RESET}")
+                for line in tail:
+                    print(f"  {line}")
+            if command_output.log is not None:
+                print_info(f"Full output: {Colors.YELLOW}{command_output.log.path}{Colors.RESET}")
             return False
         return True
     except FileNotFoundError:
@@ -139,8 +625,1066 @@ def execute_command(command_list, cwd=None, error_message="Command failed", verb
         print_error(f"An unexpected error occurred while running command: {cmd_str}\n{e}")
         return False
 
+# --- Toolchain Probe ---
+# Every tool reactango may run: the arguments that print its version, and the oldest version that works.
+TOOLCHAIN = {
+    "git": (["--version"], (2, 20)),
+    "python3": (["--version"], (3, 7)),
+    "pip3": (["--version"], None),
+    "pip": (["--version"], None),
+    "uv": (["--version"], None),
+    "node": (["--version"], (16,)),
+    "pnpm": (["--version"], None),
+    "npm": (["--version"], None),
+}
+
+class ToolStatus(NamedTuple):
+    """What the probe found out about one tool."""
+    name: str
+    path: Optional[str]
+    version: Optional[str] # e.g. '2.43.0', None if the tool is missing or its version unreadable
+    minimum: Optional[tuple]
+
+    @property
+    def ok(self) -> bool:
+        if self.path is None:
+            return False
+        if self.minimum is None:
+            return True
+        return self.version is not None and parse_version(self.version) >= self.minimum
+
+    def problem(self) -> Optional[str]:
+        """Describes why the tool can't be used, or returns None."""
+        if self.path is None:
+            return f"'{self.name}' is not installed or not in PATH."
+        if self.ok:
+            return None
+        minimum = ".".join(str(part) for part in self.minimum)
+        if self.version is None:
+            return f"Could not read the version of '{self.name}' ({self.path}); reactango needs {minimum} or newer."
+        return f"'{self.name}' {self.version} is too old; reactango needs {minimum} or newer."
+
+def parse_version(text: str) -> tuple:
+    """Extracts the first dotted number from text, e.g. 'git version 2.43.0' -> (2, 43, 0)."""
+    import re
+    match = re.search(r"\d+(?:\.\d+)*", text or "")
+    return tuple(int(part) for part in match.group().split(".")) if match else ()
+
+def _toolchain_cache_key(paths: dict) -> str:
+    """Hashes PATH plus where each tool resolves to and when that file last changed."""
+    import hashlib
+    import json
+    fingerprint = {"PATH": os.environ.get("PATH", ""), "tools": {}}
+    for name, path in sorted(paths.items()):
+        if path is not None:
+            try:
+                real_path = os.path.realpath(path)
+                fingerprint["tools"][name] = [real_path, os.stat(real_path).st_mtime_ns]
+            except OSError:
+                fingerprint["tools"][name] = [path, None]
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode("utf-8")).hexdigest()
+
+def probe_toolchain(refresh=False):
+    """
+    Finds every tool in TOOLCHAIN and its version. The version commands run
+    concurrently, and their results are cached until PATH or one of the
+    binaries changes, so repeated runs cost a few stat() calls.
+    Returns ({name: ToolStatus}, from_cache).
+    """
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = {name: find_command(name) for name in TOOLCHAIN}
+    key = _toolchain_cache_key(paths)
+    cache_path = get_cache_dir() / "toolchain.json"
+    versions = None
+    if not refresh:
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                versions = cached["versions"]
+        except (OSError, ValueError, KeyError):
+            pass
+    from_cache = versions is not None
+    if not from_cache:
+        found = [name for name, path in paths.items() if path is not None]
+
+        def read_version(name):
+            version = parse_version(_tool_version([paths[name]] + TOOLCHAIN[name][0]))
+            return ".".join(str(part) for part in version) if version else None
+
+        with ThreadPoolExecutor(max_workers=max(1, len(found))) as pool:
+            versions = dict(zip(found, pool.map(read_version, found)))
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.partial")
+            with open(partial_path, "w") as f:
+                json.dump({"key": key, "versions": versions}, f, indent=2, sort_keys=True)
+            os.replace(partial_path, cache_path)
+        except OSError:
+            pass # The cache only saves time
+    tools = {name: ToolStatus(name, paths[name], versions.get(name), minimum)
+             for name, (_, minimum) in TOOLCHAIN.items()}
+    return tools, from_cache
+
+def toolchain_requirements(options, initialize_git: bool, install_choices) -> list:
+    """
+    Returns what a create with these settings runs, as a list of groups of
+    interchangeable tools in order of preference, e.g. ('pnpm', 'npm'):
+    pnpm, or npm to install it.
+    """
+    requirements = []
+    if initialize_git or local_template_source(options.template) is None:
+        requirements.append(("git",))
+    if "backend" in install_choices:
+        requirements.append(("python3",))
+        requirements.append({"uv": ("uv",), "pip": ("pip3", "pip")}.get(options.py_installer, ("uv", "pip3", "pip")))
+    if "frontend" in install_choices:
+        requirements.append(("node",))
+        requirements.append(("pnpm",) if options.offline else ("pnpm", "npm"))
+    return requirements
+
+def toolchain_problems(tools: dict, requirements) -> list:
+    """Returns one message per requirement the probed tools don't meet. The first installed alternative is the one used."""
+    problems = []
+    for alternatives in requirements:
+        installed = [tools[name] for name in alternatives if tools[name].path is not None]
+        if not installed:
+            names = " or ".join(f"'{name}'" for name in alternatives)
+            problems.append(f"{names} is not installed or not in PATH." if len(alternatives) > 1 else tools[alternatives[0]].problem())
+        elif not installed[0].ok:
+            problems.append(installed[0].problem())
+    return problems
+
+def ensure_toolchain(options, initialize_git: bool, install_choices):
+    """Raises CreateProjectError before anything is fetched if a tool the run needs is missing or too old."""
+    with profile_phase("probe toolchain"):
+        tools, _ = probe_toolchain()
+    problems = toolchain_problems(tools, toolchain_requirements(options, initialize_git, install_choices))
+    if problems:
+        for problem in problems:
+            print_error(problem)
+        print_info(f"Run {Colors.CYAN}reactango doctor{Colors.RESET} for the full toolchain report.")
+        raise CreateProjectError("Required tools are missing or too old.")
+
+# --- Local Cache Helpers ---
+def get_cache_dir() -> Path:
+    """Returns the root directory for reactango's persistent caches."""
+    override = os.environ.get("REACTANGO_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    if os.name == 'nt':
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")).expanduser()
+    return base / "reactango"
+
+@contextmanager
+def file_lock(lock_path: Path, shared=False):
+    """
+    Holds an advisory lock on lock_path for the duration of the block.
+    Shared locks may be held by several processes at once; exclusive locks may not.
+    Windows has no shared advisory locks, so every lock is exclusive there.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+") as lock_file:
+        if os.name == 'nt':
+            import msvcrt
+            while True:
+                try:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError: # LK_LOCK gives up after ~10 seconds; keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+# --- Template Mirror Cache ---
+def template_mirror_path(repo_url: str) -> Path:
+    """Returns the location of the bare mirror cached for repo_url."""
+    import hashlib
+    url_hash = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()[:16]
+    repo_name = repo_url.rstrip("/").split("/")[-1].split(":")[-1]
+    if repo_name.endswith(".git"):
+        repo_name = repo_name[:-4]
+    repo_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in repo_name) or "template"
+    return get_cache_dir() / "templates" / f"{repo_name}-{url_hash}.git"
+
+def _mirror_stamp_path(mirror_path: Path) -> Path:
+    return mirror_path / "reactango-last-fetch"
+
+def _mirror_is_fresh(mirror_path: Path, ttl_seconds: int) -> bool:
+    try:
+        fetched_at = _mirror_stamp_path(mirror_path).stat().st_mtime
+    except OSError:
+        return False
+    return (time.time() - fetched_at) < ttl_seconds
+
+def update_template_mirror(repo_url: str, offline=False, force_refresh=False, ttl_seconds=None):
+    """
+    Makes sure a bare mirror of repo_url exists in the cache and is reasonably fresh.
+    The mirror is created with a full clone the first time and only fetched
+    incrementally afterwards, once it is older than ttl_seconds (default: REACTANGO_TEMPLATE_TTL).
+    Returns the mirror path, or None if no usable mirror is available.
+    """
+    mirror_path = template_mirror_path(repo_url)
+    with file_lock(mirror_path.with_suffix(".lock")):
+        if not (mirror_path / "HEAD").exists():
+            if offline:
+                print_error(f"--offline was given but no cached copy of '{repo_url}' exists yet. Run once without --offline first.")
+                return None
+            print_step(f"Creating template cache at '{Colors.YELLOW}{mirror_path}{Colors.RESET}'...")
+            partial_path = mirror_path.with_name(f"{mirror_path.name}.tmp-{os.getpid()}")
+            shutil.rmtree(partial_path, ignore_errors=True)
+            if not execute_command(["git", "clone", "--mirror", repo_url, str(partial_path)], error_message="Failed to mirror template repository."):
+                shutil.rmtree(partial_path, ignore_errors=True)
+                return None
+            shutil.rmtree(mirror_path, ignore_errors=True) # Leftovers of an interrupted run
+            os.replace(partial_path, mirror_path)
+            _mirror_stamp_path(mirror_path).touch()
+            record_template_refs(repo_url, mirror_path)
+        elif offline or (not force_refresh and _mirror_is_fresh(
+                mirror_path, template_cache_ttl_seconds() if ttl_seconds is None else ttl_seconds)):
+            if offline:
+                print_info("Offline mode: using the cached template without contacting the remote.")
+            else:
+                print_info("Cached template is up to date. Skipping fetch.")
+            if repo_url not in load_template_index()["templates"]: # Cached before the index existed
+                record_template_refs(repo_url, mirror_path)
+        else:
+            print_step("Updating cached template...")
+            # Git objects are content-addressed, so only objects no cached branch or tag has yet are downloaded.
+            if execute_command(["git", "--git-dir", str(mirror_path), "fetch", "--prune", "--quiet", "origin"], error_message="Failed to update cached template."):
+                _mirror_stamp_path(mirror_path).touch()
+                record_template_refs(repo_url, mirror_path)
+            else:
+                print_warning("Continuing with the previously cached template.")
+    return mirror_path
+
+# --- Template Registry ---
+TEMPLATE_INDEX_VERSION = 1
+
+def template_index_path() -> Path:
+    """Returns the JSON index of every cached template, its branches, tags and tree hashes."""
+    return get_cache_dir() / "templates" / "index.json"
+
+def load_template_index() -> dict:
+    """Reads the template index. Returns an empty index if it is missing, unreadable or from another version."""
+    import json
+    try:
+        with open(template_index_path()) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    if not isinstance(index, dict) or index.get("version") != TEMPLATE_INDEX_VERSION:
+        index = {}
+    index.setdefault("version", TEMPLATE_INDEX_VERSION)
+    index.setdefault("templates", {})
+    return index
+
+def read_template_refs(mirror_path: Path):
+    """
+    Lists the branches and tags of a mirror with one 'git for-each-ref'.
+    Returns (default branch, {branch: {commit, tree}}, {tag: {commit, tree}}), or None if git failed.
+    """
+    output = _git_output(mirror_path, "for-each-ref", "--format=%(refname)%09%(objectname)%09%(tree)%09%(*objectname)%09%(*tree)",
+                         "refs/heads", "refs/tags")
+    if output is None:
+        return None
+    branches, tags = {}, {}
+    for line in output.splitlines():
+        refname, object_id, tree, peeled_id, peeled_tree = (line.split("\t") + [""] * 5)[:5]
+        # An annotated tag points at a tag object; the commit and tree are those it peels to.
+        version = {"commit": peeled_id or object_id, "tree": peeled_tree or tree or None}
+        if refname.startswith("refs/heads/"):
+            branches[refname[len("refs/heads/"):]] = version
+        elif refname.startswith("refs/tags/"):
+            tags[refname[len("refs/tags/"):]] = version
+    head = (_git_output(mirror_path, "symbolic-ref", "--quiet", "HEAD") or "").strip()
+    default_branch = head[len("refs/heads/"):] if head.startswith("refs/heads/") else None
+    return default_branch, branches, tags
+
+def record_template_refs(repo_url: str, mirror_path: Path):
+    """Updates repo_url's entry in the template index from its mirror. The index is only a listing, so failures are ignored."""
+    import json
+    refs = read_template_refs(mirror_path)
+    if refs is None:
+        return
+    default_branch, branches, tags = refs
+    index_path = template_index_path()
+    try:
+        with file_lock(index_path.with_suffix(".lock")):
+            index = load_template_index()
+            index["templates"][repo_url] = {
+                "mirror": str(mirror_path),
+                "fetched_at": _mirror_stamp_path(mirror_path).stat().st_mtime,
+                "default_branch": default_branch,
+                "branches": branches,
+                "tags": tags,
+            }
+            partial_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.partial")
+            with open(partial_path, "w") as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+            os.replace(partial_path, index_path)
+    except OSError as e:
+        print_warning(f"Could not update the template index: {e}")
+
+def format_size(num_bytes) -> str:
+    """Formats a byte count for humans, e.g. 1536 -> '1.5 KB'."""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+def format_duration(seconds) -> str:
+    """Formats a length of time for humans, e.g. 5400 -> '1.5 h'."""
+    if seconds < 60:
+        return f"{seconds:.0f} s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f} min"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f} h"
+    return f"{seconds / 86400:.1f} days"
+
+def _extract_tar_stream(stream, target_dir: Path, mode="r|"):
+    """
+    Extracts a tar archive read sequentially from stream into target_dir.
+    Use mode "r|*" for compressed archives. Returns (files_written, bytes_written).
+    """
+    import tarfile
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    files_written = 0
+    bytes_written = 0
+    target_root = os.path.realpath(target_dir)
+    with tarfile.open(fileobj=stream, mode=mode) as archive:
+        for member in archive:
+            member_path = os.path.realpath(os.path.join(target_root, member.name))
+            if os.path.commonpath([target_root, member_path]) != target_root:
+                raise tarfile.TarError(f"Refusing to extract '{member.name}' outside of the project directory.")
+            archive.extract(member, path=target_root, **extract_kwargs)
+            if member.isfile():
+                files_written += 1
+                bytes_written += member.size
+    return files_written, bytes_written
+
+def _export_tree(git_dir, ref, target_dir: Path):
+    """
+    Streams the tree of ref from git_dir straight into target_dir through `git archive`.
+    No repository data is written to target_dir. Returns True on success.
+    """
+    import tarfile
+    command_list = ["git", "--git-dir", str(git_dir), "archive", "--format=tar", ref]
+    print_step(f"Executing: {Colors.CYAN}{' '.join(command_list)}{Colors.RESET}")
+    started_at = time.perf_counter()
+    target_dir.mkdir(parents=True)
+    try:
+        process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        print_error(f"Command '{command_list[0]}' not found. Please ensure it's installed and in your PATH.")
+        return False
+    record_process_start(command_list, process)
+    extract_error = None
+    try:
+        files_written, bytes_written = _extract_tar_stream(process.stdout, target_dir)
+    except (tarfile.TarError, OSError) as e:
+        extract_error = e
+        process.stdout.read() # Drain so git can exit on its own and report why
+    finally:
+        process.stdout.close()
+    stderr = process.stderr.read().decode("utf-8", "replace")
+    process.stderr.close()
+    rusage = wait_for_process(process)
+    record_process_span(command_list, started_at, process.returncode, rusage, pid=process.pid,
+                        output_bytes={"stderr": len(stderr)}) # stdout is the archive, consumed by the extractor
+    if process.returncode != 0 or extract_error:
+        shutil.rmtree(target_dir, ignore_errors=True)
+        if process.returncode != 0:
+            print_error(f"Failed to export template '{ref}'. (Exit code: {process.returncode})")
+            if stderr:
+                print(f"Stderr: {stderr.strip()}")
+        else:
+            print_error(f"Failed to export template files: {extract_error}")
+        return False
+    elapsed = time.perf_counter() - started_at
+    print_info(f"Exported {files_written} files ({format_size(bytes_written)} written) in {elapsed:.2f}s.")
+    return True
+
+# --- Local Template Sources ---
+TEMPLATE_ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+# Optional JSON file at the root of a template, e.g. {"immutable": ["vendor/*", "*.png"]}.
+TEMPLATE_MANIFEST_NAME = ".reactango-template.json"
+# Linux ioctl that makes a file share the extents of another (btrfs, XFS, bcachefs, ...).
+FICLONE = 0x40049409
+# errnos that mean the filesystem can't clone at all, rather than that one file failed.
+REFLINK_UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS, errno.EBADF}
+
+def local_template_source(template: str) -> Optional[Path]:
+    """
+    Returns the resolved path if template names a local directory or tarball
+    that should be copied rather than cloned, else None. Local git
+    repositories are still cloned so that --branch keeps working.
+    """
+    if "://" in template or template.startswith("git@"):
+        return None
+    path = Path(template).expanduser()
+    if path.is_dir():
+        if (path / ".git").exists() or ((path / "HEAD").is_file() and (path / "objects").is_dir()):
+            return None
+        return path.resolve()
+    if path.is_file() and path.name.lower().endswith(TEMPLATE_ARCHIVE_SUFFIXES):
+        return path.resolve()
+    return None
+
+def load_template_manifest(template_dir: Path) -> dict:
+    """Reads the template's .reactango-template.json. Returns {} if it is missing or malformed."""
+    import json
+    try:
+        with open(template_dir / TEMPLATE_MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print_warning(f"Ignoring unreadable '{TEMPLATE_MANIFEST_NAME}': {e}")
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def _scan_template_directory(source: Path):
+    """
+    Lists source without following symlinks, skipping .git.
+    Returns (directories, files, symlinks) as relative paths; parents come before their children.
+    """
+    directories, files, symlinks = [], [], []
+    pending = [""]
+    while pending:
+        relative_dir = pending.pop()
+        with os.scandir(os.path.join(source, relative_dir)) as entries:
+            for entry in entries:
+                relative_path = os.path.join(relative_dir, entry.name) if relative_dir else entry.name
+                if entry.is_symlink():
+                    symlinks.append(relative_path)
+                elif entry.is_dir():
+                    if entry.name != ".git":
+                        directories.append(relative_path)
+                        pending.append(relative_path)
+                elif entry.is_file():
+                    files.append((relative_path, entry.stat(follow_symlinks=False).st_size))
+    return directories, files, symlinks
+
+def _reflink_file(source_path: str, target_path: str) -> bool:
+    """
+    Clones source_path into target_path so both share the same blocks until one is written.
+    Returns False if this filesystem can't; raises OSError for any other failure.
+    """
+    import fcntl
+    with open(source_path, "rb") as source, open(target_path, "wb") as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError as e:
+            if e.errno in REFLINK_UNSUPPORTED_ERRNOS:
+                return False
+            raise
+    shutil.copystat(source_path, target_path)
+    return True
+
+def materialize_template_directory(source: Path, target_dir: Path) -> bool:
+    """
+    Copies a local template directory into target_dir. Each file is cloned
+    with a reflink where the filesystem supports it, hardlinked if the
+    template's manifest lists it as immutable, and copied otherwise, on a
+    thread pool since each of these is one or two system calls.
+    Returns True on success.
+    """
+    import fnmatch
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+
+    print_step(f"Copying template from '{Colors.YELLOW}{source}{Colors.RESET}'...")
+    started_at = time.perf_counter()
+    immutable_patterns = load_template_manifest(source).get("immutable", [])
+    can_reflink = sys.platform.startswith("linux")
+
+    def place_file(relative_path):
+        nonlocal can_reflink
+        source_path = os.path.join(source, relative_path)
+        target_path = os.path.join(target_dir, relative_path)
+        if any(fnmatch.fnmatch(relative_path.replace(os.sep, "/"), pattern) for pattern in immutable_patterns):
+            try:
+                os.link(source_path, target_path)
+                return "hardlinked"
+            except OSError:
+                pass # Another filesystem or links not allowed: fall through to a private copy
+        if can_reflink:
+            if _reflink_file(source_path, target_path):
+                return "reflinked"
+            can_reflink = False # One failure means the filesystem can't clone; stop trying
+        shutil.copy2(source_path, target_path)
+        return "copied"
+
+    def place_files(batch):
+        return Counter(place_file(relative_path) for relative_path, _ in batch)
+
+    try:
+        directories, files, symlinks = _scan_template_directory(source)
+        target_dir.mkdir(parents=True)
+        for relative_path in directories:
+            os.mkdir(os.path.join(target_dir, relative_path))
+        for relative_path in symlinks:
+            os.symlink(os.readlink(os.path.join(source, relative_path)), os.path.join(target_dir, relative_path))
+        # One batch per worker keeps the per-file overhead to a function call rather than a future.
+        workers = min(32, (os.cpu_count() or 1) + 4, max(1, len(files)))
+        methods = Counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for batch_methods in pool.map(place_files, [files[index::workers] for index in range(workers)]):
+                methods.update(batch_methods)
+    except OSError as e:
+        print_error(f"Failed to copy template files: {e}")
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return False
+    elapsed = time.perf_counter() - started_at
+    total_bytes = sum(size for _, size in files)
+    breakdown = ", ".join(f"{count} {method}" for method, count in sorted(methods.items()))
+    print_info(f"Copied {len(files)} files ({format_size(total_bytes)}) in {elapsed:.2f}s"
+               + (f": {breakdown}." if breakdown else "."))
+    return True
+
+def _hoist_single_directory(target_dir: Path):
+    """Moves the contents of a lone top-level directory (e.g. 'template-main/') up into target_dir."""
+    entries = list(target_dir.iterdir())
+    if len(entries) != 1 or not entries[0].is_dir() or entries[0].is_symlink():
+        return
+    wrapper = entries[0].rename(target_dir / f".reactango-unpack-{os.getpid()}")
+    for child in wrapper.iterdir():
+        child.rename(target_dir / child.name)
+    wrapper.rmdir()
+
+def extract_template_archive(archive_path: Path, target_dir: Path) -> bool:
+    """
+    Unpacks a local template tarball into target_dir, in one sequential
+    read. A single top-level directory is stripped. Returns True on success.
+    """
+    import tarfile
+    print_step(f"Unpacking template from '{Colors.YELLOW}{archive_path}{Colors.RESET}'...")
+    started_at = time.perf_counter()
+    target_dir.mkdir(parents=True)
+    try:
+        with open(archive_path, "rb") as stream:
+            files_written, bytes_written = _extract_tar_stream(stream, target_dir, mode="r|*")
+        _hoist_single_directory(target_dir)
+    except (tarfile.TarError, OSError) as e:
+        print_error(f"Failed to unpack template archive: {e}")
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return False
+    elapsed = time.perf_counter() - started_at
+    print_info(f"Unpacked {files_written} files ({format_size(bytes_written)}) in {elapsed:.2f}s.")
+    return True
+
+# --- Placeholder Substitution ---
+# Tokens a template can use anywhere in its text files, and the variable each one stands for.
+BUILTIN_PLACEHOLDERS = {
+    "__PROJECT_NAME__": "project_name",
+    "__PROJECT_SLUG__": "project_slug",
+    "__PROJECT_MODULE__": "project_module",
+    "__BACKEND_PORT__": "backend_port",
+    "__FRONTEND_PORT__": "frontend_port",
+}
+# Never rewritten, whatever the template's manifest says.
+SUBSTITUTION_ALWAYS_EXCLUDE = (".git/*", ".reactango/*", "node_modules/*", "venv/*", TEMPLATE_MANIFEST_NAME)
+# A NUL byte in the first block marks a file as binary, as git decides it.
+BINARY_SNIFF_BYTES = 8000
+
+def placeholder_variables(project_name: str, backend_port: int, frontend_port: int) -> dict:
+    """Returns the values placeholders are replaced with, e.g. 'My App' -> slug 'my-app', module 'my_app'."""
+    import re
+    slug = re.sub(r"[^a-z0-9]+", "-", project_name.lower()).strip("-") or "project"
+    module = slug.replace("-", "_")
+    if module[0].isdigit():
+        module = f"_{module}"
+    return {
+        "project_name": project_name,
+        "project_slug": slug,
+        "project_module": module,
+        "backend_port": str(backend_port),
+        "frontend_port": str(frontend_port),
+    }
+
+def template_replacements(manifest: dict, variables: dict) -> dict:
+    """
+    Maps each placeholder string (as bytes) to its replacement: the built-in tokens,
+    plus the manifest's "placeholders", which map literal template identifiers to a variable name.
+    """
+    placeholders = dict(BUILTIN_PLACEHOLDERS)
+    placeholders.update(manifest.get("substitute", {}).get("placeholders", {}))
+    replacements = {}
+    for placeholder, variable in placeholders.items():
+        if variable not in variables:
+            print_warning(f"Ignoring placeholder '{placeholder}': unknown variable '{variable}'.")
+            continue
+        if placeholder:
+            replacements[placeholder.encode("utf-8")] = variables[variable].encode("utf-8")
+    return replacements
+
+def _substitution_candidates(project_dir: Path, manifest: dict):
+    """Yields the relative paths of regular files the manifest's include/exclude globs select."""
+    import fnmatch
+    rules = manifest.get("substitute", {})
+    include = rules.get("include", ["*"])
+    exclude = list(rules.get("exclude", [])) + list(manifest.get("immutable", [])) + list(SUBSTITUTION_ALWAYS_EXCLUDE)
+    pending = [""]
+    while pending:
+        relative_dir = pending.pop()
+        with os.scandir(os.path.join(project_dir, relative_dir)) as entries:
+            for entry in entries:
+                relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    if not any(fnmatch.fnmatch(f"{relative_path}/", pattern) for pattern in exclude):
+                        pending.append(relative_path) # 'dir/*' excludes the whole directory
+                elif (entry.is_file() and any(fnmatch.fnmatch(relative_path, pattern) for pattern in include)
+                      and not any(fnmatch.fnmatch(relative_path, pattern) for pattern in exclude)):
+                    yield relative_path
+
+def _substitute_file(path: str, pattern, replacements: dict) -> Optional[bool]:
+    """
+    Replaces every placeholder in the file at path. The file is mapped into
+    memory and searched in place; only a file with a match is rewritten,
+    streamed segment by segment into a temporary file that then replaces it.
+    Returns True if it changed, False if not, None if it is binary.
+    """
+    import mmap
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            if content.find(b"\0", 0, BINARY_SNIFF_BYTES) != -1:
+                return None
+            match = pattern.search(content)
+            if match is None:
+                return False
+            partial_path = f"{path}.reactango-partial"
+            with open(partial_path, "wb") as out:
+                position = 0
+                while match is not None:
+                    out.write(content[position:match.start()])
+                    out.write(replacements[match.group()])
+                    position = match.end()
+                    match = pattern.search(content, position)
+                out.write(content[position:])
+    shutil.copymode(path, partial_path)
+    os.replace(partial_path, path) # A new inode, so a hardlinked or reflinked template file is left alone
+    return True
+
+def substitute_placeholders(project_dir: Path, variables: dict) -> bool:
+    """
+    Replaces template placeholders (see BUILTIN_PLACEHOLDERS) with the
+    project's values in every text file selected by the template manifest,
+    on a thread pool. Binary files are skipped. Returns True on success.
+    """
+    import re
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+
+    print_step("Filling in template placeholders...")
+    started_at = time.perf_counter()
+    manifest = load_template_manifest(project_dir)
+    replacements = template_replacements(manifest, variables)
+    # Longest first, so that a placeholder that contains another one wins.
+    pattern = re.compile(b"|".join(re.escape(placeholder) for placeholder in sorted(replacements, key=len, reverse=True)))
+
+    def substitute_batch(batch):
+        outcomes = Counter()
+        for relative_path in batch:
+            outcome = _substitute_file(os.path.join(project_dir, relative_path), pattern, replacements)
+            outcomes["binary" if outcome is None else ("changed" if outcome else "unchanged")] += 1
+        return outcomes
+
+    try:
+        candidates = list(_substitution_candidates(project_dir, manifest))
+        workers = min(32, (os.cpu_count() or 1) + 4, max(1, len(candidates)))
+        outcomes = Counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for batch_outcomes in pool.map(substitute_batch, [candidates[index::workers] for index in range(workers)]):
+                outcomes.update(batch_outcomes)
+    except OSError as e:
+        print_error(f"Failed to fill in template placeholders: {e}")
+        return False
+    elapsed = time.perf_counter() - started_at
+    print_info(f"Scanned {len(candidates)} files, changed {outcomes['changed']}"
+               f" (skipped {outcomes['binary']} binary) in {elapsed:.2f}s.")
+    return True
+
+def fetch_template(repo_url: str, branch, target_dir: Path, use_cache=True, offline=False, force_refresh=False, export=True):
+    """
+    Puts the template's files into target_dir.
+    With use_cache the files come from the local mirror, which is shared
+    safely between concurrent runs; otherwise the remote is contacted directly.
+    With export only the tree of the requested branch/tag/commit is written;
+    otherwise a full clone (including .git) is made.
+    A local directory or tarball is copied instead and needs neither git nor the cache.
+    """
+    local_source = local_template_source(repo_url)
+    if local_source is not None:
+        if branch:
+            print_warning(f"Ignoring --branch '{branch}': '{local_source}' is not a git repository.")
+        if local_source.is_dir():
+            return materialize_template_directory(local_source, target_dir)
+        return extract_template_archive(local_source, target_dir)
+
+    ref = branch or "HEAD"
+    if use_cache:
+        mirror_path = update_template_mirror(repo_url, offline=offline, force_refresh=force_refresh)
+        if mirror_path is None:
+            return False
+        # A shared lock keeps a concurrent fetch from pruning objects mid-checkout.
+        with file_lock(mirror_path.with_suffix(".lock"), shared=True):
+            if export:
+                if _export_tree(mirror_path, ref, target_dir):
+                    return True
+                print_known_template_versions(repo_url)
+                return False
+            git_clone_command = ["git", "clone", "--local"]
+            if branch:
+                git_clone_command.extend(["--branch", branch])
+            git_clone_command.extend([str(mirror_path), str(target_dir)])
+            return execute_command(git_clone_command, error_message="Failed to check out template from cache.")
+
+    if export:
+        # Only the requested commit is fetched, into a scratch repository that is thrown away.
+        import tempfile
+        scratch_dir = tempfile.mkdtemp(prefix="reactango-export-")
+        try:
+            if not execute_command(["git", "init", "--quiet", "--bare", scratch_dir], error_message="Failed to prepare template export."):
+                return False
+            if not execute_command(["git", "--git-dir", scratch_dir, "fetch", "--quiet", "--depth", "1", "--no-tags", repo_url, ref],
+                                   error_message="Failed to fetch template repository."):
+                return False
+            return _export_tree(scratch_dir, "FETCH_HEAD", target_dir)
+        finally:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    git_clone_command = ["git", "clone"]
+    if branch:
+        git_clone_command.extend(["--branch", branch])
+    git_clone_command.extend([repo_url, str(target_dir)])
+    return execute_command(git_clone_command, error_message="Failed to clone template repository.")
+
+# --- Virtual Environment Cache ---
+VENV_CACHE_MAX_SIZE = os.environ.get("REACTANGO_VENV_CACHE_MAX_SIZE", "5GB")
+
+def parse_size(text: str) -> int:
+    """Parses sizes such as '500MB', '2G' or '1024' into a byte count."""
+    units = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2, "G": 1024 ** 3, "GB": 1024 ** 3}
+    value = text.strip().upper()
+    number = value.rstrip("KMGB")
+    unit = value[len(number):]
+    try:
+        return int(float(number) * units[unit])
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid size: '{text}'")
+
+def get_venv_cache_dir() -> Path:
+    return get_cache_dir() / "venvs"
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+def venv_cache_key(requirements_file: Path, python_executable: str):
+    """
+    Computes the cache key of a venv built by python_executable from requirements_file.
+    The key covers the requirements, the interpreter version and location, and the platform.
+    Returns (key, details) or (None, None) if the interpreter could not be queried.
+    """
+    import hashlib
+    probe = "import sys, sysconfig; print(sys.version.split()[0]); print(sysconfig.get_platform()); print(sys.executable)"
+    try:
+        result = subprocess.run([python_executable, "-c", probe], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                universal_newlines=True, check=True)
+        python_version, platform_tag, interpreter_path = result.stdout.splitlines()[:3]
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None, None
+    details = {
+        "requirements_sha256": hashlib.sha256(requirements_file.read_bytes()).hexdigest(),
+        "python_version": python_version,
+        "platform": platform_tag,
+        "interpreter": os.path.realpath(interpreter_path),
+    }
+    key_source = "\n".join(f"{name}={details[name]}" for name in sorted(details))
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()[:32], details
+
+def _read_venv_cache_meta(entry_dir: Path):
+    import json
+    try:
+        return json.loads((entry_dir / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+
+def _write_venv_cache_meta(entry_dir: Path, meta: dict):
+    import json
+    partial_path = entry_dir / f"meta.json.tmp-{os.getpid()}-{threading.get_ident()}"
+    partial_path.write_text(json.dumps(meta, indent=2))
+    os.replace(partial_path, entry_dir / "meta.json")
+
+def _is_text_file(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return b"\0" not in f.read(1024)
+
+def _copy_venv_tree(source: Path, destination: Path, old_prefix: str, new_prefix: str, link_files: bool):
+    """
+    Copies the venv at source to destination, keeping symlinks as they are.
+    Scripts in bin/ and pyvenv.cfg that mention old_prefix are rewritten to new_prefix
+    so shebangs and activate scripts point at the new location. With link_files,
+    everything else is cloned with a reflink where the filesystem supports it and
+    otherwise hardlinked to source's read-only files. As root, which writes to
+    read-only files anyway, it is copied instead. Files that aren't hardlinked
+    are the destination's own and stay writable.
+    """
+    old_bytes, new_bytes = old_prefix.encode("utf-8"), new_prefix.encode("utf-8")
+    can_reflink = link_files and sys.platform.startswith("linux")
+    can_hardlink = link_files and not (hasattr(os, "geteuid") and os.geteuid() == 0)
+    for root, dirs, files in os.walk(source):
+        relative_root = Path(root).relative_to(source)
+        target_root = destination / relative_root
+        target_root.mkdir(parents=True, exist_ok=True)
+        for name in list(dirs):
+            source_path = Path(root) / name
+            if source_path.is_symlink(): # e.g. lib64 -> lib; don't descend twice
+                os.symlink(os.readlink(source_path), target_root / name)
+                dirs.remove(name)
+        for name in files:
+            source_path = Path(root) / name
+            target_path = target_root / name
+            if source_path.is_symlink():
+                os.symlink(os.readlink(source_path), target_path)
+                continue
+            needs_rewrite = (relative_root.parts[:1] == ("bin",) or relative_root == Path(".")) and _is_text_file(source_path)
+            if needs_rewrite:
+                content = source_path.read_bytes()
+                if old_bytes in content:
+                    target_path.write_bytes(content.replace(old_bytes, new_bytes))
+                    shutil.copystat(source_path, target_path)
+                    os.chmod(target_path, os.stat(target_path).st_mode | 0o200)
+                    continue
+            if can_reflink:
+                try:
+                    if _reflink_file(str(source_path), str(target_path)):
+                        os.chmod(target_path, os.stat(target_path).st_mode | 0o200)
+                        continue
+                except OSError:
+                    pass
+                can_reflink = False # Unsupported here; don't try again for every file
+                if target_path.exists():
+                    target_path.unlink()
+            if can_hardlink:
+                try:
+                    os.link(source_path, target_path)
+                    continue
+                except OSError:
+                    can_hardlink = False # Different filesystem; copy from now on
+            shutil.copy2(source_path, target_path)
+            os.chmod(target_path, os.stat(target_path).st_mode | 0o200)
+
+def _make_tree_read_only(path: Path):
+    """
+    Clears the write bits of every regular file under path. Projects hardlink
+    these files, so an in-place edit in one of them must fail rather than
+    change the cache and every other project. Directories stay writable so
+    that pip can still replace or remove files.
+    """
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                os.chmod(file_path, os.stat(file_path).st_mode & ~0o222)
+
+def restore_cached_venv(cache_key: str, venv_path: Path) -> bool:
+    """Materializes the cached venv for cache_key at venv_path. Returns True on a cache hit."""
+    entry_dir = get_venv_cache_dir() / cache_key
+    with file_lock(entry_dir.with_suffix(".lock"), shared=True):
+        meta = _read_venv_cache_meta(entry_dir)
+        if meta is None or not (entry_dir / "venv").is_dir():
+            return False
+        started_at = time.monotonic()
+        try:
+            with profile_phase("restore cached venv"):
+                # Entries cached before their files were made read-only are copied, so no project can write through to them.
+                _copy_venv_tree(entry_dir / "venv", venv_path, meta["source_prefix"], str(venv_path),
+                                link_files=meta.get("read_only", False))
+        except OSError as e:
+            print_warning(f"Could not restore cached virtual environment ({e}). Falling back to a normal install.")
+            shutil.rmtree(venv_path, ignore_errors=True)
+            return False
+        meta["last_used"] = time.time()
+        _write_venv_cache_meta(entry_dir, meta)
+    print_success(f"Restored virtual environment from cache in {time.monotonic() - started_at:.2f}s.")
+    return True
+
+def store_venv_in_cache(cache_key: str, details: dict, venv_path: Path):
+    """Copies a freshly installed venv into the cache, then trims the cache to its size limit."""
+    cache_dir = get_venv_cache_dir()
+    entry_dir = cache_dir / cache_key
+    with file_lock(entry_dir.with_suffix(".lock")):
+        if (entry_dir / "meta.json").exists():
+            return # Another process populated it first
+        partial_dir = cache_dir / f"{cache_key}.tmp-{os.getpid()}-{threading.get_ident()}"
+        shutil.rmtree(partial_dir, ignore_errors=True)
+        try:
+            with profile_phase("store venv in cache"):
+                _copy_venv_tree(venv_path, partial_dir / "venv", str(venv_path), str(venv_path), link_files=False)
+                _make_tree_read_only(partial_dir / "venv")
+            meta = dict(details, key=cache_key, source_prefix=str(venv_path), created_at=time.time(),
+                        last_used=time.time(), size_bytes=_directory_size(partial_dir / "venv"), read_only=True)
+            _write_venv_cache_meta(partial_dir, meta)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(partial_dir, entry_dir)
+        except OSError as e:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+            print_warning(f"Could not store virtual environment in cache: {e}")
+            return
+    print_info(f"Virtual environment cached for future projects ({format_size(meta['size_bytes'])}).")
+    try:
+        prune_venv_cache(parse_size(VENV_CACHE_MAX_SIZE))
+    except ValueError as e:
+        print_warning(f"Ignoring REACTANGO_VENV_CACHE_MAX_SIZE: {e}")
+
+def list_venv_cache():
+    """Returns the metadata of every cached venv, most recently used first."""
+    cache_dir = get_venv_cache_dir()
+    if not cache_dir.is_dir():
+        return []
+    entries = []
+    for entry_dir in cache_dir.iterdir():
+        if entry_dir.is_dir() and ".tmp-" not in entry_dir.name:
+            meta = _read_venv_cache_meta(entry_dir)
+            if meta is not None:
+                entries.append(meta)
+    return sorted(entries, key=lambda meta: meta.get("last_used", 0), reverse=True)
+
+def prune_venv_cache(max_size_bytes: int):
+    """Removes least recently used venvs until the cache fits in max_size_bytes. Returns (removed, bytes_freed)."""
+    entries = list_venv_cache()
+    total_size = sum(meta.get("size_bytes", 0) for meta in entries)
+    removed = 0
+    bytes_freed = 0
+    while entries and total_size > max_size_bytes:
+        meta = entries.pop() # Least recently used
+        entry_dir = get_venv_cache_dir() / meta["key"]
+        with file_lock(entry_dir.with_suffix(".lock")):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        total_size -= meta.get("size_bytes", 0)
+        bytes_freed += meta.get("size_bytes", 0)
+        removed += 1
+    return removed, bytes_freed
+
+# --- Python Installer Backends ---
+def venv_python_path(venv_path: Path) -> Path:
+    """Returns the interpreter inside the venv at venv_path."""
+    if os.name == 'nt':
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+class PythonInstaller:
+    """
+    Creates virtual environments and installs requirements files into them.
+    Subclasses wrap one installer tool; select one with get_python_installer().
+    """
+    name = None
+
+    def check_available(self) -> bool:
+        """Returns True if the installer can run, printing an error otherwise."""
+        raise NotImplementedError
+
+    def create_venv_command(self, python_executable: str, venv_path: Path, wheelhouse=None):
+        return [python_executable, "-m", "venv", str(venv_path)]
+
+    def install_command(self, requirements_file: Path, venv_path=None, wheelhouse=None):
+        """Returns the command that installs requirements_file, into venv_path if given."""
+        raise NotImplementedError
+
+    @staticmethod
+    def wheelhouse_arguments(wheelhouse):
+        if wheelhouse is None:
+            return []
+        return ["--no-index", "--find-links", str(wheelhouse)]
+
+class PipInstaller(PythonInstaller):
+    """Installs with pip, resolving and installing one package at a time."""
+    name = "pip"
+
+    def __init__(self):
+        self.pip_command_name = "pip3" if command_exists("pip3") else "pip"
+
+    def check_available(self):
+        if not command_exists(self.pip_command_name):
+            print_error(f"pip ('{self.pip_command_name}') is not installed or not in PATH. Please install pip.")
+            return False
+        return True
+
+    def install_command(self, requirements_file, venv_path=None, wheelhouse=None):
+        pip_to_use = self.pip_command_name
+        if venv_path is not None:
+            if os.name == 'nt': # Windows
+                pip_to_use = str(venv_path / "Scripts" / f"{self.pip_command_name}.exe")
+            else: # macOS/Linux
+                pip_to_use = str(venv_path / "bin" / self.pip_command_name)
+        return [pip_to_use, "install", "-r", str(requirements_file)] + self.wheelhouse_arguments(wheelhouse)
+
+class UvInstaller(PythonInstaller):
+    """Installs with uv, which resolves and downloads packages in parallel."""
+    name = "uv"
+
+    def check_available(self):
+        if not command_exists("uv"):
+            print_error("uv is not installed or not in PATH. Install it or use '--py-installer pip'.")
+            return False
+        return True
+
+    def create_venv_command(self, python_executable, venv_path, wheelhouse=None):
+        if wheelhouse is not None:
+            # Seeding pip would need an index; the stdlib venv bundles it instead.
+            return super().create_venv_command(python_executable, venv_path, wheelhouse)
+        # --seed keeps pip available inside the venv, like 'python -m venv' does.
+        return ["uv", "venv", "--seed", "--python", python_executable, str(venv_path)]
+
+    def install_command(self, requirements_file, venv_path=None, wheelhouse=None):
+        target = ["--python", str(venv_python_path(venv_path))] if venv_path is not None else ["--system"]
+        return ["uv", "pip", "install"] + target + ["-r", str(requirements_file)] + self.wheelhouse_arguments(wheelhouse)
+
+PYTHON_INSTALLERS = {"pip": PipInstaller, "uv": UvInstaller}
+
+def get_python_installer(choice="auto") -> PythonInstaller:
+    """Returns the installer for choice; 'auto' prefers uv and falls back to pip."""
+    if choice == "auto":
+        choice = "uv" if command_exists("uv") else "pip"
+    return PYTHON_INSTALLERS[choice]()
+
 # --- Python Installation Logic ---
-def install_backend_dependencies(project_path: Path, use_venv: bool):
+def install_backend_dependencies(project_path: Path, use_venv: bool, use_venv_cache=True, py_installer="auto", wheelhouse=None,
+                                 reuse_existing_venv=False):
+    """
+    Installs requirements.txt, into the project's venv when use_venv is set.
+    With reuse_existing_venv, an existing venv is updated in place instead of being
+    created or restored from the cache, so only changed requirements are installed.
+    """
     print(f"\n{Colors.BRIGHT_MAGENTA}{'='*60}{Colors.RESET}")
     print(f"{Colors.BRIGHT_MAGENTA}{EMOJI_PYTHON} BACKEND DEPENDENCY INSTALLATION {EMOJI_PYTHON}{Colors.RESET}")
     print(f"{Colors.BRIGHT_MAGENTA}{'='*60}{Colors.RESET}")
@@ -149,9 +1693,14 @@ def install_backend_dependencies(project_path: Path, use_venv: bool):
         print_error("Python 3 ('python3') is not installed or not in PATH. Please install Python 3.")
         return False
 
-    pip_command_name = "pip3" if command_exists("pip3") else "pip"
-    if not command_exists(pip_command_name):
-        print_error(f"pip ('{pip_command_name}') is not installed or not in PATH. Please install pip.")
+    installer = get_python_installer(py_installer)
+    if not installer.check_available():
+        return False
+
+    if wheelhouse is not None:
+        wheelhouse = Path(wheelhouse).resolve() # pip runs inside the project directory
+    if wheelhouse is not None and not wheelhouse.is_dir():
+        print_error(f"Wheelhouse directory '{wheelhouse}' does not exist.")
         return False
 
     python_executable = "python3"
@@ -160,36 +1709,148 @@ def install_backend_dependencies(project_path: Path, use_venv: bool):
         print_warning(f"'requirements.txt' not found in {project_path}. Skipping backend dependencies.")
         return True # Not a failure of this function, just nothing to do.
 
-    pip_to_use = pip_command_name
+    if use_venv and reuse_existing_venv and venv_python_path(project_path / "venv").exists():
+        print_info("Updating the existing virtual environment.")
+        if not _install_backend_packages(project_path, installer, python_executable, requirements_file, use_venv, wheelhouse,
+                                         create_venv=False):
+            return False
+        print_success("Backend dependencies installed successfully! 🎊")
+        return True
+
+    cache_key = None
+    if use_venv and use_venv_cache and os.name != 'nt': # Windows launchers embed absolute paths and can't be relocated
+        cache_key, cache_details = venv_cache_key(requirements_file, python_executable)
+
+    if cache_key is None:
+        if not _install_backend_packages(project_path, installer, python_executable, requirements_file, use_venv, wheelhouse):
+            return False
+    else:
+        venv_path = project_path / "venv"
+        # Only one process builds a given environment; concurrent creates wait for it and then restore it.
+        with file_lock(get_venv_cache_dir() / f"{cache_key}.build.lock"):
+            if not restore_cached_venv(cache_key, venv_path):
+                if not _install_backend_packages(project_path, installer, python_executable, requirements_file, use_venv, wheelhouse):
+                    return False
+                store_venv_in_cache(cache_key, cache_details, venv_path)
+
+    print_success("Backend dependencies installed successfully! 🎊")
+    return True
+
+def _install_backend_packages(project_path: Path, installer: PythonInstaller, python_executable: str, requirements_file: Path, use_venv: bool, wheelhouse=None,
+                              create_venv=True):
+    """Creates the project's venv if requested and installs requirements_file with installer."""
+    venv_path = None
     activate_command = ""
 
-    if use_venv:
+    if use_venv and not create_venv:
+        venv_path = project_path / "venv"
+    elif use_venv:
         venv_path = project_path / "venv"
         print_step(f"Creating Python virtual environment at '{Colors.YELLOW}{venv_path}{Colors.RESET}'...")
-        if not execute_command([python_executable, "-m", "venv", str(venv_path)], cwd=project_path, error_message="Failed to create virtual environment."):
-            return False
+        with profile_phase("create venv"):
+            if not execute_command(installer.create_venv_command(python_executable, venv_path, wheelhouse), cwd=project_path, error_message="Failed to create virtual environment."):
+                return False
 
         if os.name == 'nt': # Windows
-            pip_in_venv = venv_path / "Scripts" / f"{pip_command_name}.exe"
             activate_command = f"cd {project_path.name} && .\\venv\\Scripts\\activate" # Simplified for next steps
         else: # macOS/Linux
-            pip_in_venv = venv_path / "bin" / pip_command_name
             activate_command = f"cd {project_path.name} && source venv/bin/activate"
 
-        pip_to_use = str(pip_in_venv)
         print_info(f"Virtual environment created. To activate it later: {Colors.CYAN}{activate_command.replace(f'cd {project_path.name} && ', '')}{Colors.RESET}")
     else:
         print_info("Not using a virtual environment for Python dependencies.")
 
-    print_step(f"Installing Python packages from '{Colors.YELLOW}{requirements_file}{Colors.RESET}' using '{Colors.CYAN}{pip_to_use}{Colors.RESET}'...")
-    if not execute_command([pip_to_use, "install", "-r", str(requirements_file)], cwd=project_path, error_message="Failed to install Python dependencies."):
-        return False
+    source_note = f" from wheelhouse '{Colors.YELLOW}{wheelhouse}{Colors.RESET}'" if wheelhouse is not None else ""
+    print_step(f"Installing Python packages from '{Colors.YELLOW}{requirements_file}{Colors.RESET}' using '{Colors.CYAN}{installer.name}{Colors.RESET}'{source_note}...")
+    with profile_phase("install python packages"):
+        return execute_command(installer.install_command(requirements_file, venv_path, wheelhouse), cwd=project_path, error_message="Failed to install Python dependencies.")
 
-    print_success("Backend dependencies installed successfully! 🎊")
+# --- Node.js Installation Logic ---
+def get_pnpm_store_dir() -> Path:
+    """Returns the pnpm content-addressable store shared by all projects created by reactango."""
+    override = os.environ.get("REACTANGO_PNPM_STORE")
+    if override:
+        return Path(override).expanduser()
+    return get_cache_dir() / "pnpm-store"
+
+def pnpm_store_arguments(use_shared_store=True, offline=False):
+    """
+    Returns the pnpm flags for installing from the shared store.
+    Packages already in the store are hardlinked without asking the registry;
+    with offline, the registry is never contacted at all.
+    """
+    if not use_shared_store:
+        return ["--offline"] if offline else []
+    return ["--store-dir", str(get_pnpm_store_dir()), "--offline" if offline else "--prefer-offline"]
+
+# --- Bytecode Precompilation ---
+# Never compiled: installed by other steps, or not part of the project's Python code.
+PRECOMPILE_SKIP_NAMES = {"venv", "node_modules", ".git", ".reactango"}
+
+def precompile_roots(project_path: Path, use_venv: bool) -> list:
+    """Returns the venv's library directory plus the project's own top-level directories and .py files."""
+    roots = []
+    venv_lib = project_path / "venv" / ("Lib" if os.name == 'nt' else "lib")
+    if use_venv and venv_lib.is_dir():
+        roots.append(venv_lib)
+    for entry in sorted(project_path.iterdir()):
+        if entry.name in PRECOMPILE_SKIP_NAMES or entry.name.startswith(".") or entry.is_symlink():
+            continue
+        if entry.is_dir() or entry.suffix == ".py":
+            roots.append(entry)
+    return roots
+
+def precompile_backend(project_path: Path, use_venv=True) -> bool:
+    """
+    Byte-compiles the venv's packages and the project's Python code with the
+    interpreter that will run them, on every core ('compileall -j 0'), so the
+    first 'manage.py runserver' doesn't pay for it. Files that are already
+    compiled are skipped. A file that can't be compiled is reported but not
+    treated as a failure, since pip tolerates them too. Returns True unless
+    the compiler could not run.
+    """
+    venv_python = venv_python_path(project_path / "venv")
+    python_executable = str(venv_python) if use_venv and venv_python.exists() else find_command("python3")
+    if python_executable is None:
+        print_warning("No Python interpreter found. Skipping bytecode precompilation.")
+        return True
+    roots = precompile_roots(project_path, use_venv)
+    if not roots:
+        return True
+    command_list = [python_executable, "-m", "compileall", "-j", "0"] + [str(root) for root in roots]
+    print_step("Precompiling Python bytecode in the background...")
+    started_at = time.perf_counter()
+    compiled = 0
+    errors = []
+    try:
+        # Read here rather than through execute_command: compileall prints a line per file, which is only counted.
+        process = subprocess.Popen(command_list, cwd=project_path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except OSError as e:
+        print_warning(f"Could not run the bytecode compiler: {e}")
+        return True
+    record_process_start(command_list, process, project_path)
+    output_size = 0
+    with process.stdout:
+        for raw_line in process.stdout:
+            output_size += len(raw_line)
+            if raw_line.startswith(b"Compiling "):
+                compiled += 1
+            elif raw_line.startswith(b"***"): # Follows the 'Compiling' line of the file that failed
+                compiled -= 1
+                errors.append(raw_line.decode("utf-8", "replace").lstrip("* ").rstrip())
+    rusage = wait_for_process(process)
+    record_process_span(command_list, started_at, process.returncode, rusage, pid=process.pid, output_bytes={"stdout": output_size})
+    elapsed = time.perf_counter() - started_at
+    print_info(f"Precompiled {compiled} modules in {elapsed:.2f}s.")
+    if errors:
+        print_warning(f"{len(errors)} file(s) could not be compiled:")
+        for line in errors[:OUTPUT_TAIL_LINES]:
+            print(f"  {Colors.DIM}{line}{Colors.RESET}")
+    elif process.returncode != 0:
+        print_warning(f"The bytecode compiler exited with code {process.returncode}.")
     return True
 
-# --- Node.js Installation Logic ---
-def install_frontend_dependencies(project_path: Path):
+def install_frontend_dependencies(project_path: Path, use_shared_store=True, offline=False):
     print(f"\n{Colors.BRIGHT_GREEN}{'='*60}{Colors.RESET}")
     print(f"{Colors.BRIGHT_GREEN}{EMOJI_NODE} FRONTEND DEPENDENCY INSTALLATION {EMOJI_NODE}{Colors.RESET}")
     print(f"{Colors.BRIGHT_GREEN}{'='*60}{Colors.RESET}")
@@ -203,104 +1864,930 @@ def install_frontend_dependencies(project_path: Path):
         print_warning(f"'package.json' not found in {project_path}. Skipping frontend dependencies.")
         return True # Not a failure, just nothing to do.
 
+    if not command_exists("pnpm") and offline:
+        print_error("pnpm is not installed or not in PATH, and it can't be installed in offline mode.")
+        return False
+
     if not command_exists("pnpm"):
         print_info("pnpm not found. Attempting to install pnpm globally using npm...")
         if not command_exists("npm"):
             print_error("npm is not installed or not in PATH. Cannot install pnpm. Please install pnpm or npm manually.")
             return False
-        if not execute_command(["npm", "install", "-g", "pnpm"], error_message="Failed to install pnpm globally."):
-            return False
+        with profile_phase("install pnpm"):
+            if not execute_command(["npm", "install", "-g", "pnpm"], error_message="Failed to install pnpm globally."):
+                return False
         print_success("pnpm installed globally. You might need to open a new terminal for 'pnpm' to be available.")
+        _command_paths.clear() # pnpm is on PATH now
 
-    print_step("Installing Node.js packages with pnpm...")
-    if not execute_command(["pnpm", "install"], cwd=project_path, error_message="Failed to install Node.js dependencies."):
-        return False
+    store_note = f" from store '{Colors.YELLOW}{get_pnpm_store_dir()}{Colors.RESET}'" if use_shared_store else ""
+    print_step(f"Installing Node.js packages with pnpm{store_note}...")
+    pnpm_command = ["pnpm", "install"] + pnpm_store_arguments(use_shared_store, offline)
+    with profile_phase("install node packages"):
+        if not execute_command(pnpm_command, cwd=project_path, error_message="Failed to install Node.js dependencies."):
+            return False
 
     print_success("Frontend dependencies installed successfully! 🎊")
     return True
 
-# --- Main Project Setup Orchestrator ---
-def run_project_setup(project_path: Path, install_be: bool, install_fe: bool, use_venv_for_be: bool):
-    """Runs the full project setup (backend and/or frontend)."""
-    print(f"\n{Colors.BRIGHT_CYAN}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BRIGHT_CYAN}{EMOJI_INSTALL} STARTING DEPENDENCY INSTALLATIONS {EMOJI_INSTALL}{Colors.RESET}")
-    print(f"{Colors.BRIGHT_CYAN}{'='*70}{Colors.RESET}")
-    
+# --- Incremental Sync ---
+def _venv_python_version(venv_path: Path) -> Optional[str]:
+    """Reads the Python version of a venv from its pyvenv.cfg, without starting the interpreter."""
+    try:
+        with open(venv_path / "pyvenv.cfg") as f:
+            settings = dict(line.split("=", 1) for line in f if "=" in line)
+    except OSError:
+        return None
+    settings = {key.strip(): value.strip() for key, value in settings.items()}
+    return settings.get("version") or settings.get("version_info")
+
+def _tool_version(command_list) -> Optional[str]:
+    try:
+        result = subprocess.run(command_list, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+def dependency_fingerprint(project_path: Path, side: str, use_venv=True) -> Optional[str]:
+    """
+    Fingerprints what an install of side ('backend' or 'frontend') depends on:
+    the manifest, the lockfile and the interpreter version. Returns None when
+    there is nothing installed to compare against (no venv or no node_modules).
+    """
+    if side == "backend":
+        if use_venv:
+            runtime = _venv_python_version(project_path / "venv")
+        else:
+            runtime = _tool_version(["python3", "-c", "import sys; print(sys.version)"])
+        inputs = ("requirements.txt",)
+    else:
+        runtime = _tool_version(["node", "--version"]) if (project_path / "node_modules").is_dir() else None
+        inputs = ("package.json", "pnpm-lock.yaml")
+    if runtime is None:
+        return None
+    return f"{hash_step_inputs(project_path, inputs)}:{runtime}"
+
+def _sync_state_path(project_path: Path) -> Path:
+    return project_path / ".reactango" / "sync.json"
+
+def _read_sync_state(project_path: Path) -> dict:
+    import json
+    try:
+        with open(_sync_state_path(project_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# The backend and frontend steps may finish at the same time; each must keep the other's fingerprint.
+_sync_state_lock = threading.Lock()
+
+def record_sync_fingerprint(project_path: Path, side: str, use_venv=True):
+    """Remembers the fingerprint of a successful install of side, so that 'reactango sync' can skip it next time."""
+    import json
+    import tempfile
+    fingerprint = dependency_fingerprint(project_path, side, use_venv)
+    if fingerprint is None:
+        return
+    state_dir = project_state_dir(project_path)
+    with _sync_state_lock:
+        state = _read_sync_state(project_path)
+        state[side] = {"fingerprint": fingerprint, "synced_at": time.time()}
+        with tempfile.NamedTemporaryFile("w", dir=str(state_dir), prefix="sync.", suffix=".tmp", delete=False) as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(f.name, _sync_state_path(project_path))
+
+def sync_project(project_path: Path, sides=("backend", "frontend"), force=False, py_installer="auto",
+                 use_shared_store=True, offline=False) -> bool:
+    """
+    Brings the dependencies of an existing project up to date. A side whose
+    fingerprint matches the last successful install is skipped; otherwise the
+    existing venv/node_modules are updated in place. Returns True on success.
+    """
+    state = _read_sync_state(project_path)
+    try:
+        use_venv = CreateJournal.load(project_path).state["options"].get("with_venv", True)
+    except (ValueError, KeyError): # Not created by reactango, or by an older version
+        use_venv = True
+    manifests = {"backend": "requirements.txt", "frontend": "package.json"}
     all_successful = True
-    installations_run = 0
-    
-    if install_be:
-        installations_run += 1
-        print_info(f"[{installations_run}] Starting backend dependency installation...")
-        if not install_backend_dependencies(project_path, use_venv_for_be):
-            all_successful = False
-            print_error("Backend dependency installation failed.")
+    for side in sides:
+        if not (project_path / manifests[side]).exists():
+            continue
+        fingerprint = dependency_fingerprint(project_path, side, use_venv)
+        if not force and fingerprint is not None and state.get(side, {}).get("fingerprint") == fingerprint:
+            print_success(f"{side.capitalize()} dependencies are up to date.")
+            continue
+        if side == "backend":
+            ok = install_backend_dependencies(project_path, use_venv, py_installer=py_installer, reuse_existing_venv=True)
+        else:
+            ok = install_frontend_dependencies(project_path, use_shared_store=use_shared_store, offline=offline)
+        if ok:
+            record_sync_fingerprint(project_path, side, use_venv)
         else:
-            print_success("Backend installation completed successfully!")
-            
-    if install_fe:
-        installations_run += 1
-        print_info(f"[{installations_run}] Starting frontend dependency installation...")
-        if not install_frontend_dependencies(project_path):
             all_successful = False
-            print_error("Frontend dependency installation failed.")
+    return all_successful
+
+# --- Deduplication Store ---
+DEDUPE_INDEX_VERSION = 1
+DEDUPE_MODES = ("auto", "reflink", "hardlink")
+# Directories whose files tools replace rather than edit in place, so sharing one inode between projects is safe there.
+DEDUPE_HARDLINK_DIRS = ("venv", "node_modules")
+# Never deduplicated: git's objects are per repository and .reactango holds per-project state.
+DEDUPE_SKIP_NAMES = {".git", ".reactango"}
+# Marks a reflinked file with the object it was cloned from, since a clone has an inode of its own.
+DEDUPE_XATTR = "user.reactango.dedupe"
+
+class DedupeStore:
+    """
+    A content-addressed store of files shared between projects. Each object
+    lives at objects/<sha256[:2]>/<sha256[2:]>, with an '.x' suffix for
+    executables since a hardlink shares its mode. index.json maps each
+    object to its inode, so a file hardlinked to the store is recognised
+    by stat() alone instead of being hashed again.
+    """
+    def __init__(self, root: Path):
+        self.root = Path(root).expanduser().resolve()
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.json"
+        self.objects = {} # key -> [st_dev, st_ino, size, 'hardlink' or 'reflink']
+        self._inodes = {} # (st_dev, st_ino) -> key
+        self._lock = threading.Lock()
+
+    def load(self):
+        import json
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        self.objects = index.get("objects", {}) if index.get("version") == DEDUPE_INDEX_VERSION else {}
+        self._inodes = {(entry[0], entry[1]): key for key, entry in self.objects.items()}
+
+    def save(self):
+        import json
+        partial_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.partial")
+        with open(partial_path, "w") as f:
+            json.dump({"version": DEDUPE_INDEX_VERSION, "objects": self.objects}, f)
+        os.replace(partial_path, self.index_path)
+
+    def object_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / key[2:]
+
+    def key_for_inode(self, info) -> Optional[str]:
+        """Returns the key of the object whose inode info describes, if any."""
+        return self._inodes.get((info.st_dev, info.st_ino))
+
+    def _forget(self, key: str):
+        entry = self.objects.pop(key, None)
+        if entry is not None:
+            self._inodes.pop((entry[0], entry[1]), None)
+
+    def lookup(self, key: str):
+        """Returns the stat of the object for key, or None (forgetting it) if it is gone."""
+        with self._lock:
+            try:
+                return os.stat(self.object_path(key))
+            except FileNotFoundError:
+                self._forget(key)
+                return None
+
+    def lookup_or_add(self, key: str, source_path: str, use_reflink: bool):
+        """
+        Returns the stat of the object for key. If there is none yet,
+        source_path becomes it, as a clone or (with hardlinks) the file
+        itself, and None is returned.
+        """
+        object_path = self.object_path(key)
+        with self._lock: # Two files with the same content must not both become the object
+            try:
+                return os.stat(object_path)
+            except FileNotFoundError:
+                self._forget(key)
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path = f"{object_path}.{os.getpid()}.partial"
+            if use_reflink:
+                if not _reflink_file(source_path, partial_path):
+                    os.unlink(partial_path)
+                    raise OSError(errno.EOPNOTSUPP, "reflinks are not supported here")
+            else:
+                os.link(source_path, partial_path)
+            # Read-only, so that an in-place edit of a hardlinked file fails instead of changing every project.
+            os.chmod(partial_path, os.stat(partial_path).st_mode & ~0o222)
+            os.replace(partial_path, object_path)
+            info = os.stat(object_path)
+            self.objects[key] = [info.st_dev, info.st_ino, info.st_size, "reflink" if use_reflink else "hardlink"]
+            self._inodes[(info.st_dev, info.st_ino)] = key
+        return None
+
+def _hash_file(path: str) -> str:
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _reflink_marker(key: str, info) -> bytes:
+    # Any write changes the size or mtime, which invalidates the marker.
+    return f"{key}:{info.st_size}:{info.st_mtime_ns}".encode()
+
+def _mark_reflinked(path: str, key: str):
+    try:
+        os.setxattr(path, DEDUPE_XATTR, _reflink_marker(key, os.stat(path)))
+    except (AttributeError, OSError):
+        pass # Without xattrs the file is just hashed again next time
+
+def _is_marked_reflinked(path: str, info) -> bool:
+    try:
+        marker = os.getxattr(path, DEDUPE_XATTR)
+    except (AttributeError, OSError):
+        return False
+    return marker == _reflink_marker(marker.split(b":", 1)[0].decode("ascii", "replace"), info)
+
+def _replace_with_object(path: str, object_path: Path, use_reflink: bool):
+    """Atomically swaps the file at path for a clone of, or a hardlink to, object_path."""
+    partial_path = f"{path}.reactango-dedupe"
+    if use_reflink:
+        if not _reflink_file(str(object_path), partial_path):
+            os.unlink(partial_path)
+            raise OSError(errno.EOPNOTSUPP, "reflinks are not supported here")
+        shutil.copystat(path, partial_path) # A clone is the project's own file again; keep its mode and times
+    else:
+        os.link(object_path, partial_path)
+    os.replace(partial_path, path)
+
+def _dedupe_candidates(root: Path, min_size: int):
+    """Yields (path, stat, inside venv/ or node_modules/) for every regular file under root worth deduplicating."""
+    import stat as stat_module
+    pending = [(str(root), False)]
+    while pending:
+        directory, in_dependencies = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in DEDUPE_SKIP_NAMES:
+                        pending.append((entry.path, in_dependencies or entry.name in DEDUPE_HARDLINK_DIRS))
+                elif entry.is_file(follow_symlinks=False) and not entry.name.endswith(".reactango-dedupe"):
+                    info = entry.stat(follow_symlinks=False)
+                    if stat_module.S_ISREG(info.st_mode) and info.st_size >= max(1, min_size):
+                        yield entry.path, info, in_dependencies
+
+def _probe_reflinks(directory: Path) -> bool:
+    """Returns True if files in directory can be cloned with a reflink."""
+    if not sys.platform.startswith("linux"):
+        return False
+    probe_path = directory / f"reflink-probe.{os.getpid()}"
+    clone_path = directory / f"reflink-probe.{os.getpid()}.clone"
+    try:
+        probe_path.write_bytes(b"reactango")
+        return _reflink_file(str(probe_path), str(clone_path))
+    except OSError:
+        return False
+    finally:
+        for leftover in (probe_path, clone_path):
+            try:
+                leftover.unlink()
+            except FileNotFoundError:
+                pass
+
+def dedupe_paths(roots, store: DedupeStore, mode="auto", min_size=1) -> Optional[dict]:
+    """
+    Replaces files under roots with links to identical objects in store,
+    adding an object for every content it hasn't seen. 'reflink' makes
+    every file a copy-on-write clone, so a later edit never reaches other
+    projects. 'hardlink' shares the inode and makes it read-only; root
+    ignores that, so as root it falls back to what 'auto' does. 'auto'
+    uses reflinks where the filesystem has them and otherwise hardlinks
+    only inside venv/ and node_modules/. Files already hardlinked elsewhere
+    (e.g. from pnpm's store) are left alone. Returns counts for the report,
+    or None if the store could not be used.
+    """
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        store.root.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print_error(f"Could not create the dedupe store '{store.root}': {e}")
+        return None
+    # One probe decides for the whole run; the store and the projects must share a filesystem anyway.
+    use_reflink = mode != "hardlink" and _probe_reflinks(store.root)
+    if mode == "reflink" and not use_reflink:
+        print_error(f"The filesystem of '{store.root}' does not support reflinks. Use --dedupe-mode auto or hardlink.")
+        return None
+    hardlink_everything = mode == "hardlink"
+    if hardlink_everything and hasattr(os, "geteuid") and os.geteuid() == 0:
+        # Root writes to read-only files anyway, so an in-place edit of a shared source file would reach every project.
+        print_warning("Running as root, which ignores read-only files: only venv/ and node_modules/ are hardlinked.")
+        hardlink_everything = False
+
+    def dedupe_file(path, info, in_dependencies):
+        if not use_reflink and not hardlink_everything and not in_dependencies:
+            return "skipped", 0 # Sources may be edited in place; only a clone is safe for them
+        if store.key_for_inode(info) is not None:
+            return "already shared", 0
+        if info.st_nlink > 1:
+            return "linked elsewhere", 0
+        if use_reflink and _is_marked_reflinked(path, info):
+            return "already shared", 0
+        key = _hash_file(path) + (".x" if info.st_mode & 0o111 else "")
+        object_info = store.lookup_or_add(key, path, use_reflink)
+        if object_info is None: # This file's content is the object now
+            if use_reflink:
+                _mark_reflinked(path, key)
+            return "stored", 0
+        if object_info.st_size != info.st_size: # Changed under us; never spread that
+            return "mismatched", 0
+        _replace_with_object(path, store.object_path(key), use_reflink)
+        if use_reflink:
+            _mark_reflinked(path, key)
+        return "newly shared", info.st_size
+
+    def dedupe_batch(batch):
+        outcomes, reclaimed = Counter(), 0
+        for path, info, in_dependencies in batch:
+            try:
+                outcome, size = dedupe_file(path, info, in_dependencies)
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    raise # Every other file would fail the same way
+                outcome, size = "failed", 0
+            outcomes[outcome] += 1
+            reclaimed += size
+        return outcomes, reclaimed
+
+    print_step(f"Deduplicating into '{Colors.YELLOW}{store.root}{Colors.RESET}' with {'reflinks' if use_reflink else 'hardlinks'}...")
+    started_at = time.perf_counter()
+    outcomes, reclaimed = Counter(), 0
+    with file_lock(store.root / "lock"):
+        store.load()
+        try:
+            candidates = [candidate for root in roots for candidate in _dedupe_candidates(Path(root), min_size)]
+            # Hashing reads and linking are I/O bound, so more threads than cores still help.
+            workers = max(1, min(32, (os.cpu_count() or 1) + 4, len(candidates)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for batch_outcomes, batch_reclaimed in pool.map(dedupe_batch, [candidates[i::workers] for i in range(workers)]):
+                    outcomes.update(batch_outcomes)
+                    reclaimed += batch_reclaimed
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                print_error(f"The dedupe store '{store.root}' must be on the same filesystem as the projects.")
+            else:
+                print_error(f"Deduplication failed: {e}")
+            return None
+        finally:
+            store.save()
+    elapsed = time.perf_counter() - started_at
+    scanned = sum(outcomes.values())
+    print_info(f"Scanned {scanned} files in {elapsed:.2f}s: "
+               + ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items())) + ".")
+    print_success(f"Reclaimed {format_size(reclaimed)}.")
+    return dict(outcomes, scanned=scanned, reclaimed_bytes=reclaimed, seconds=elapsed)
+
+def prune_dedupe_store(store: DedupeStore):
+    """
+    Removes hardlinked objects no project links to any more. A reflinked
+    object can't tell whether clones of it remain, so those are kept.
+    Returns (objects removed, bytes freed).
+    """
+    removed, bytes_freed = 0, 0
+    with file_lock(store.root / "lock"):
+        store.load()
+        for key, entry in list(store.objects.items()):
+            info = store.lookup(key)
+            if info is not None and entry[3] == "hardlink" and info.st_nlink == 1:
+                os.unlink(store.object_path(key))
+                store.lookup(key) # Forgets it
+                removed += 1
+                bytes_freed += info.st_size
+        store.save()
+    return removed, bytes_freed
+
+# --- Step Graph Scheduler ---
+class Step(NamedTuple):
+    """
+    One unit of work in a step graph. run() returns True on success.
+    after names steps that must have finished first, whatever their result,
+    unlike requires, which also needs them to have succeeded.
+    inputs and outputs are the project-relative paths the step reads and writes.
+    estimate is the expected duration in seconds, used until a real one has been recorded.
+    """
+    name: str
+    run: Callable[[], bool]
+    requires: tuple = ()
+    after: tuple = ()
+    inputs: tuple = ()
+    outputs: tuple = ()
+    estimate: float = 1.0
+    color: str = ""
+
+def _step_timings_path() -> Path:
+    return get_cache_dir() / "step-timings.json"
+
+def load_step_timings() -> dict:
+    """Returns {step name: seconds} as measured by the most recent runs."""
+    import json
+    try:
+        with open(_step_timings_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_step_timings(durations: dict):
+    import json
+    timings = load_step_timings()
+    timings.update({name: round(seconds, 3) for name, seconds in durations.items()})
+    try:
+        _step_timings_path().parent.mkdir(parents=True, exist_ok=True)
+        with open(_step_timings_path(), "w") as f:
+            json.dump(timings, f, indent=2, sort_keys=True)
+    except OSError:
+        pass # Timings only improve --plan; never fail a run over them
+
+def step_predecessors(step) -> tuple:
+    """Every step that must finish before step starts, through requires or after."""
+    return step.requires + step.after
+
+def order_steps(steps):
+    """
+    Returns the steps in a valid execution order, keeping the given order where possible.
+    Raises ValueError for unknown requirements or cycles.
+    """
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        for required in step_predecessors(step):
+            if required not in by_name:
+                raise ValueError(f"Step '{step.name}' requires unknown step '{required}'.")
+    ordered, done = [], set()
+    while len(ordered) < len(steps):
+        ready = [step for step in steps if step.name not in done and all(r in done for r in step_predecessors(step))]
+        if not ready:
+            cycle = sorted(step.name for step in steps if step.name not in done)
+            raise ValueError(f"Steps {', '.join(cycle)} depend on each other.")
+        ordered.append(ready[0])
+        done.add(ready[0].name)
+    return ordered
+
+def critical_path(steps, durations):
+    """Returns (total seconds, [step names]) of the longest chain of dependent steps."""
+    finish = {}
+    previous = {}
+    for step in order_steps(steps):
+        start = 0.0
+        if step_predecessors(step):
+            previous[step.name] = max(step_predecessors(step), key=finish.get)
+            start = finish[previous[step.name]]
+        finish[step.name] = start + durations.get(step.name, step.estimate)
+    if not finish:
+        return 0.0, []
+    name = max(finish, key=finish.get)
+    total, path = finish[name], [name]
+    while path[-1] in previous:
+        path.append(previous[path[-1]])
+    return total, list(reversed(path))
+
+def _remaining_path_lengths(steps, durations):
+    """Longest duration from the start of each step to the end of the graph, used as scheduling priority."""
+    dependents = {step.name: [] for step in steps}
+    for step in steps:
+        for required in step_predecessors(step):
+            dependents[required].append(step.name)
+    remaining = {}
+    for step in reversed(order_steps(steps)):
+        after = max((remaining[name] for name in dependents[step.name]), default=0.0)
+        remaining[step.name] = durations.get(step.name, step.estimate) + after
+    return remaining
+
+def overlapping_steps(steps) -> set:
+    """
+    Returns the names of steps that may run at the same time as another step,
+    i.e. that are neither before nor after every other step in the graph.
+    Predecessors outside steps (e.g. already completed ones) are ignored.
+    """
+    names = {step.name for step in steps}
+    steps = [step._replace(requires=tuple(name for name in step.requires if name in names),
+                           after=tuple(name for name in step.after if name in names)) for step in steps]
+    before = {}
+    for step in order_steps(steps):
+        before[step.name] = set()
+        for name in step_predecessors(step):
+            before[step.name] |= {name} | before[name]
+    return {step.name for step in steps
+            if any(other.name != step.name and other.name not in before[step.name] and step.name not in before[other.name]
+                   for other in steps)}
+
+def print_step_plan(steps, jobs):
+    """Prints the step graph with each step's requirements, inputs, outputs and expected duration."""
+    durations = load_step_timings()
+    print(f"{Colors.BOLD}{'STEP':<22}{'AFTER':<28}{'READS':<32}{'WRITES':<16}{'TIME':>8}{Colors.RESET}")
+    for step in order_steps(steps):
+        seconds = durations.get(step.name)
+        time_text = f"{seconds:.1f}s" if seconds is not None else f"~{step.estimate:.1f}s"
+        predecessors = list(step.requires) + [f"({name})" for name in step.after]
+        print(f"{step.color}{step.name:<22}{Colors.RESET}{', '.join(predecessors) or '-':<28}"
+              f"{', '.join(step.inputs) or '-':<32}{', '.join(step.outputs) or '-':<16}{time_text:>8}")
+    total, path = critical_path(steps, durations)
+    print(f"\n{Colors.BRIGHT_CYAN}Critical path ({total:.1f}s):{Colors.RESET} {' → '.join(path)}")
+    print(f"{Colors.DIM}Up to {jobs} step(s) at a time. Times are from the last run; '~' marks estimates.")
+    print(f"A step in parentheses only has to finish first, not succeed.{Colors.RESET}")
+
+def run_step_graph(steps, jobs=4, completed=(), on_success=None):
+    """
+    Runs steps as soon as everything they require has succeeded and everything
+    they run after has finished, at most jobs at a time, longest remaining chain first. A failed step skips everything that
+    depends on it; independent steps still run. Steps named in completed count
+    as already done. on_success(step) is called after every step that succeeds.
+    Returns {step name: 'ok' | 'failed' | 'skipped'}.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    priority = _remaining_path_lengths(steps, load_step_timings())
+    status = {name: "ok" for name in completed}
+    pending = sorted((step for step in order_steps(steps) if step.name not in status), key=lambda step: -priority[step.name])
+    # Only steps that can overlap get their output piped and tagged; the others write to the terminal directly,
+    # which keeps pip's and pnpm's colours and progress bars.
+    tagged = overlapping_steps(pending) if jobs > 1 else set()
+    durations = {}
+    parent_prefix = current_output_prefix()
+    parent_phase = current_phase()
+
+    def run_one(step):
+        return run_in_phase(f"{parent_phase}/{step.name}" if parent_phase else step.name, run_step, step)
+
+    def run_step(step):
+        started_at = time.perf_counter()
+        try:
+            with profile_phase(f"step: {step.name}"):
+                ok = bool(step.run())
+            if ok and on_success is not None:
+                on_success(step)
+        except Exception as e:
+            print_error(f"Step '{step.name}' failed unexpectedly: {e}")
+            ok = False
+        if ok:
+            durations[step.name] = time.perf_counter() - started_at
+        return ok
+
+    def settle():
+        """Marks steps whose requirements failed as skipped, transitively."""
+        changed = True
+        while changed:
+            changed = False
+            for step in list(pending):
+                if any(status.get(r) in ("failed", "skipped") for r in step.requires):
+                    print_warning(f"Skipping '{step.name}' because a step it needs did not succeed.")
+                    status[step.name] = "skipped"
+                    pending.remove(step)
+                    changed = True
+
+    def next_ready():
+        for step in pending:
+            if all(status.get(r) == "ok" for r in step.requires) and all(r in status for r in step.after):
+                pending.remove(step)
+                return step
+        return None
+
+    if jobs <= 1: # Serial: run in this thread, in dependency order, so tracebacks and debuggers behave normally
+        while pending:
+            settle()
+            step = next_ready()
+            if step is None:
+                break
+            status[step.name] = "ok" if run_one(step) else "failed"
+    else:
+        with (prefixed_output() if tagged else nullcontext()), ThreadPoolExecutor(max_workers=jobs) as executor:
+            running = {}
+            while pending or running:
+                settle()
+                while len(running) < jobs:
+                    step = next_ready()
+                    if step is None:
+                        break
+                    prefix = parent_prefix
+                    if step.name in tagged:
+                        tag = f"{step.color}[{step.name}]{Colors.RESET}"
+                        prefix = f"{parent_prefix} {tag}" if parent_prefix else tag
+                    running[executor.submit(run_with_output_prefix, prefix, run_one, step)] = step
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    status[step.name] = "ok" if future.result() else "failed"
+
+    save_step_timings(durations)
+    return status
+
+# --- Git Bootstrap Steps ---
+def git_init_repository(target_dir: Path) -> bool:
+    """Creates an empty repository in target_dir."""
+    print(f"\n{Colors.BRIGHT_BLUE}{EMOJI_GIT} Initializing a new git repository in '{Colors.YELLOW}{target_dir}{Colors.RESET}{Colors.BRIGHT_BLUE}'...{Colors.RESET}")
+    with profile_phase("git init"):
+        if not execute_command(["git", "init"], cwd=str(target_dir), error_message="Failed to initialize git repository."):
+            return False
+    print(f"{Colors.BRIGHT_GREEN}{EMOJI_SPARKLES} New git repository initialized.{Colors.RESET}")
+    return True
+
+def git_add_all(target_dir: Path) -> bool:
+    """Stages every file in target_dir."""
+    print_step("Adding files to the new repository...")
+    with profile_phase("git add"):
+        return execute_command(["git", "add", "."], cwd=str(target_dir), error_message="Failed to add files to git.")
+
+def _git_output(target_dir: Path, *arguments) -> Optional[str]:
+    """Runs a read-only git command in target_dir and returns its stdout, or None if it failed."""
+    try:
+        result = subprocess.run(["git"] + list(arguments), cwd=str(target_dir), stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.decode("utf-8", errors="surrogateescape")
+
+def _fast_import_path(path: str) -> str:
+    """Quotes a path for a fast-import 'M' command when it would otherwise be misread."""
+    if not path.startswith('"') and "\n" not in path:
+        return path
+    return '"' + path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+def _fast_import_unsupported_reason(target_dir: Path, paths) -> Optional[str]:
+    """
+    Returns why git add/commit could produce a different commit than writing the
+    files as they are, or None if the single-pass bootstrap is exact here.
+    """
+    config = {}
+    for line in (_git_output(target_dir, "config", "--list", "-z") or "").split("\0"):
+        key, _, value = line.partition("\n")
+        config[key.lower()] = value
+    if config.get("core.autocrlf", "false").lower() in ("true", "input"):
+        return "core.autocrlf converts line endings"
+    if any(path == ".gitattributes" or path.endswith("/.gitattributes") for path in paths):
+        return "the template has .gitattributes (filters or line-ending rules)"
+    if "core.hookspath" in config or any(not hook.name.endswith(".sample") for hook in (target_dir / ".git" / "hooks").glob("*")):
+        return "commit hooks are configured"
+    if config.get("commit.gpgsign", "false").lower() == "true":
+        return "commits are signed"
+    if any(path.endswith("/") for path in paths):
+        return "the template contains nested git repositories"
+    return None
+
+def git_fast_bootstrap(target_dir: Path, project_name: str) -> bool:
+    """
+    Creates the repository and its initial commit in one pass: every file is read
+    once and streamed into 'git fast-import', which writes a single pack, instead
+    of 'git add' hashing the tree into loose objects and 'git commit' reading them
+    back. Commits exactly what git init/add/commit would, and falls back to them
+    where that can't be guaranteed (see _fast_import_unsupported_reason).
+    """
+    import stat as stat_module
+    if not git_init_repository(target_dir):
+        return False
+    print_step("Writing the initial commit with a single 'git fast-import' pass...")
+    started_at = time.perf_counter()
+    initial_commit_message = f"Initial commit: Bootstrap '{project_name}' from ReactTangoTemplate"
+
+    # Exactly the files 'git add .' would pick up, honouring .gitignore and the user's excludes.
+    listing = _git_output(target_dir, "ls-files", "--others", "--exclude-standard", "-z")
+    paths = sorted(path for path in (listing or "").split("\0") if path)
+    reason = "git could not list the project's files" if listing is None else _fast_import_unsupported_reason(target_dir, paths)
+    branch = (_git_output(target_dir, "symbolic-ref", "HEAD") or "").strip()
+    author = (_git_output(target_dir, "var", "GIT_AUTHOR_IDENT") or "").strip()
+    committer = (_git_output(target_dir, "var", "GIT_COMMITTER_IDENT") or "").strip()
+    if reason is None and not (branch and author and committer):
+        reason = "git has no branch or identity to commit with"
+    if reason is not None:
+        print_info(f"Using git add/commit instead: {reason}.")
+        return git_add_all(target_dir) and git_commit_initial(target_dir, project_name)
+
+    track_file_mode = (_git_output(target_dir, "config", "--bool", "core.fileMode") or "true").strip() != "false"
+    # Store objects the way 'git add' does, without deltas and with fast compression; the pack can be repacked later.
+    command_list = ["git", "-c", "core.compression=1", "fast-import", "--quiet", "--done", "--depth=0"]
+    with profile_phase("git fast-import"):
+        process_started_at = time.perf_counter()
+        process = subprocess.Popen(command_list, cwd=str(target_dir), stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        record_process_start(command_list, process, target_dir)
+        total_bytes = 0
+        try:
+            stream = process.stdin
+            modes = []
+            for mark, path in enumerate(paths, start=1):
+                full_path = target_dir / path
+                info = os.lstat(full_path)
+                modes.append(info.st_mode)
+                stream.write(f"blob\nmark :{mark}\n".encode())
+                if stat_module.S_ISLNK(info.st_mode):
+                    content = os.fsencode(os.readlink(full_path))
+                    stream.write(f"data {len(content)}\n".encode() + content + b"\n")
+                else:
+                    stream.write(f"data {info.st_size}\n".encode())
+                    with open(full_path, "rb") as f:
+                        shutil.copyfileobj(f, stream, 1024 * 1024)
+                    stream.write(b"\n")
+                total_bytes += info.st_size
+            message = (initial_commit_message + "\n").encode("utf-8")
+            stream.write(f"commit {branch}\nauthor {author}\ncommitter {committer}\ndata {len(message)}\n".encode("utf-8") + message)
+            for mark, (path, mode) in enumerate(zip(paths, modes), start=1):
+                if stat_module.S_ISLNK(mode):
+                    git_mode = "120000"
+                elif track_file_mode and mode & stat_module.S_IXUSR:
+                    git_mode = "100755"
+                else:
+                    git_mode = "100644"
+                stream.write(f"M {git_mode} :{mark} {_fast_import_path(path)}\n".encode("utf-8", errors="surrogateescape"))
+            stream.write(b"\ndone\n")
+            stream.close()
+        except OSError as e: # fast-import died (its stderr says why) or a file vanished
+            print_error(f"Failed to stream the project into git fast-import: {e}")
+        errors = process.stderr.read().decode("utf-8", errors="replace").strip()
+        rusage = wait_for_process(process)
+        record_process_span(command_list, process_started_at, process.returncode, rusage, pid=process.pid,
+                            output_bytes={"stderr": len(errors)})
+    if process.returncode != 0:
+        print_error(f"Failed to write the initial commit (Exit code: {process.returncode})" + (f": {errors}" if errors else ""))
+        return False
+    # Populate the index from the new commit so the working tree shows up as clean.
+    if not execute_command(["git", "read-tree", "HEAD"], cwd=str(target_dir), error_message="Failed to update the git index."):
+        return False
+    print_success(f"Initial commit made: \"{initial_commit_message}\" "
+                  f"({len(paths)} files, {format_size(total_bytes)} in {time.perf_counter() - started_at:.2f}s)")
+    return True
+
+def git_commit_initial(target_dir: Path, project_name: str) -> bool:
+    """Commits the staged files as the project's first commit."""
+    print_step("Making initial commit...")
+    initial_commit_message = f"Initial commit: Bootstrap '{project_name}' from ReactTangoTemplate"
+    with profile_phase("git commit"):
+        if not execute_command(["git", "commit", "-m", initial_commit_message], cwd=str(target_dir), error_message="Failed to make initial commit."):
+            return False
+    print_success(f"Initial commit made: \"{initial_commit_message}\"")
+    return True
+
+class CreateProjectError(Exception):
+    """Raised when a project can't be created. exit_code is 0 when the user cancelled."""
+    def __init__(self, message, exit_code=1):
+        super().__init__(message)
+        self.exit_code = exit_code
+
+class CreateOptions(NamedTuple):
+    """
+    Everything 'create' needs to know, independent of argparse.
+    init_git and install set to None mean "ask interactively".
+    install is one of 'all', 'backend', 'frontend' or 'none'.
+    """
+    project_name: str
+    directory: Optional[Path] = None # Defaults to ./<project_name>
+    branch: Optional[str] = None
+    template: str = TEMPLATE_REPO_URL
+    offline: bool = False
+    refresh_template: bool = False
+    template_prefetched: bool = False # The template cache was already updated by the caller
+    use_template_cache: bool = True
+    full_clone: bool = False
+    init_git: Optional[bool] = None
+    install: Optional[str] = None
+    with_venv: bool = True
+    use_venv_cache: bool = True
+    parallel_install: bool = False
+    py_installer: str = "auto"
+    wheelhouse: Optional[str] = None
+    use_shared_store: bool = True
+    quiet_install: bool = False # Show a progress line instead of the full command output
+    install_log: bool = False # Tee command output to .reactango/logs/create.log in the project
+    jobs: int = 4 # Steps that may run at the same time; 1 runs them one after another
+    git_bootstrap: str = "fast" # 'fast' (one git fast-import pass) or 'classic' (git init/add/commit)
+    precompile: bool = True # Byte-compile venv/ and the project's Python code after the backend install
+    backend_port: int = 8000 # Fills __BACKEND_PORT__ in the template
+    frontend_port: int = 5173 # Fills __FRONTEND_PORT__ in the template
+    dedupe_store: Optional[str] = None # Share identical files with other projects through this content-addressed store
+    dedupe_mode: str = "auto" # 'auto', 'reflink' or 'hardlink'; see dedupe_paths()
+
+def project_state_dir(project_path: Path) -> Path:
+    """Returns the project's .reactango directory, creating it (ignored by git) if needed."""
+    state_dir = project_path / ".reactango"
+    state_dir.mkdir(exist_ok=True)
+    gitignore = state_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Created by reactango; local state only.\n*\n")
+    return state_dir
+
+# --- Create Journal ---
+def hash_step_inputs(project_path: Path, inputs) -> str:
+    """
+    Fingerprints the files a step reads. Directories only count by their
+    existence, so '.' (the whole tree) never invalidates a step by itself.
+    """
+    import hashlib
+    digest = hashlib.sha256()
+    for relative_path in sorted(inputs):
+        path = project_path / relative_path
+        digest.update(relative_path.encode("utf-8") + b"\0")
+        if path.is_file():
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
         else:
-            print_success("Frontend installation completed successfully!")
+            digest.update(b"<dir>" if path.is_dir() else b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
 
-    if all_successful and (install_be or install_fe): # Only show if something was attempted
-        print(f"\n{Colors.BRIGHT_GREEN}{'='*70}{Colors.RESET}")
-        print_party(f"ALL DEPENDENCY INSTALLATIONS COMPLETED SUCCESSFULLY! {EMOJI_SPARKLES}")
-        print(f"{Colors.BRIGHT_GREEN}{'='*70}{Colors.RESET}")
-    elif not all_successful:
-        print(f"\n{Colors.BRIGHT_YELLOW}{'='*70}{Colors.RESET}")
-        print_warning("Dependency installation completed with some issues. Please review the logs above.")
-        print(f"{Colors.BRIGHT_YELLOW}{'='*70}{Colors.RESET}")
-    
-    return all_successful
+class CreateJournal:
+    """
+    Records in <project>/.reactango/state.json how a project was created and
+    which steps finished, with a fingerprint of their inputs, so that
+    'reactango resume' can continue after a failure without redoing them.
+    """
+    VERSION = 1
 
-def handle_create_project(args):
-    """Handles the logic for the 'create' subcommand."""
-    project_name = args.project_name
-    branch_to_clone = args.branch
+    def __init__(self, project_path: Path, state=None):
+        self.project_path = project_path
+        self.path = project_path / ".reactango" / "state.json"
+        self.state = state or {"version": self.VERSION, "steps": {}}
+        self._lock = threading.Lock()
 
-    target_dir = Path(project_name).resolve()
+    @classmethod
+    def load(cls, project_path: Path):
+        """Reads the journal of project_path. Raises ValueError if there is none or it is unreadable."""
+        import json
+        journal = cls(project_path)
+        try:
+            with open(journal.path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"'{project_path}' has no {journal.path.relative_to(project_path)}; it was not created by this version of reactango.")
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not read '{journal.path}': {e}")
+        if state.get("version") != cls.VERSION:
+            raise ValueError(f"'{journal.path}' was written by an incompatible version of reactango.")
+        journal.state = state
+        return journal
 
-    if target_dir.exists():
-        print_error(f"Directory '{target_dir}' already exists. Please choose a different name or remove the existing directory.")
-        sys.exit(1)
+    def _save(self):
+        import json
+        temporary_path = self.path.with_suffix(".tmp")
+        with open(temporary_path, "w") as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(temporary_path, self.path) # Never leave a half-written journal behind
 
-    print(f"{Colors.BRIGHT_CYAN}{EMOJI_CLONE} Cloning ReactTangoTemplate into '{Colors.YELLOW}{project_name}{Colors.RESET}{Colors.BRIGHT_CYAN}'...{Colors.RESET}")
-    git_clone_command = ["git", "clone"]
-    if branch_to_clone:
-        git_clone_command.extend(["--branch", branch_to_clone])
-    git_clone_command.extend([TEMPLATE_REPO_URL, str(target_dir)])
+    def start(self, options: CreateOptions, initialize_git: bool, install_choices):
+        """Records the settings of the run; steps recorded before are kept."""
+        settings = options._asdict()
+        settings["directory"] = str(self.project_path)
+        settings.pop("template_prefetched")
+        with self._lock:
+            self.state.update({"options": settings, "initialize_git": initialize_git, "install_choices": list(install_choices)})
+            self._save()
+
+    def record(self, step: Step):
+        with self._lock:
+            self.state["steps"][step.name] = {
+                "inputs": hash_step_inputs(self.project_path, step.inputs),
+                # A step may legitimately produce nothing (e.g. no package.json); only check what it did produce.
+                "outputs": [output for output in step.outputs if (self.project_path / output).exists()],
+                "completed_at": time.time(),
+            }
+            self._save()
 
-    if not execute_command(git_clone_command, error_message="Failed to clone template repository."):
-        sys.exit(1)
-    print_success(f"Template cloned successfully into '{Colors.YELLOW}{target_dir}{Colors.RESET}'.")
+    def create_options(self, **overrides) -> CreateOptions:
+        """Rebuilds the CreateOptions of the recorded run, ignoring settings this version doesn't know."""
+        settings = {key: value for key, value in self.state["options"].items() if key in CreateOptions._fields}
+        settings["directory"] = self.project_path
+        settings.update(overrides)
+        return CreateOptions(**settings)
 
-    git_dir_path = target_dir / ".git"
-    if git_dir_path.exists() and git_dir_path.is_dir():
-        print_step("Removing template's .git directory...")
-        try:
-            shutil.rmtree(git_dir_path)
-            print(f"{Colors.BRIGHT_GREEN}{EMOJI_SPARKLES} Template .git directory removed.{Colors.RESET}")
-        except OSError as e:
-            print_warning(f"Could not remove .git directory: {e}. Please remove it manually.")
-    else:
-        print_warning("Template .git directory not found after clone. Skipping removal.")
+    def completed_steps(self, steps):
+        """
+        Returns the names of steps that finished, still have the same inputs and
+        whose outputs are still present. A step only counts if everything it
+        requires counts too.
+        """
+        recorded = self.state.get("steps", {})
+        valid = set()
+        for step in order_steps(steps):
+            entry = recorded.get(step.name)
+            if (entry is not None
+                    and all(required in valid for required in step.requires)
+                    and entry.get("inputs") == hash_step_inputs(self.project_path, step.inputs)
+                    and all((self.project_path / output).exists() for output in entry.get("outputs", ()))):
+                valid.add(step.name)
+        return valid
 
+def resolve_create_choices(options: CreateOptions):
+    """
+    Settles whether to initialize git and what to install, prompting only for
+    what options leave open, so that no question interrupts the run later.
+    Returns (initialize_git, install_choices) with install_choices a subset of ['backend', 'frontend'].
+    Raises CreateProjectError if the user cancels.
+    """
     # --- Git Initialization ---
     should_initialize_git = False
     if is_git_available():
-        if args.force_init_git:
+        if options.init_git is True:
             should_initialize_git = True
             print_step("--init-git flag used: Forcing git initialization.")
-        elif args.force_no_init_git:
+        elif options.init_git is False:
             should_initialize_git = False
             print(f"{Colors.BRIGHT_YELLOW}{EMOJI_SKIP} --no-init-git flag used: Skipping git initialization.{Colors.RESET}")
         else:
             try:
+                questionary, custom_style = load_questionary()
                 init_choice = questionary.confirm(
                     f"{EMOJI_PROMPT} Initialize a new git repository in the project?",
                     default=True, 
@@ -309,132 +2796,265 @@ def handle_create_project(args):
                 ).ask()
                 if init_choice is None: # User pressed Ctrl+C or Esc
                     print(f"\n{Colors.BRIGHT_RED}{EMOJI_CANCEL} Operation cancelled by user. Exiting.{Colors.RESET}")
-                    sys.exit(0)
+                    raise CreateProjectError("Operation cancelled by user.", exit_code=0)
                 should_initialize_git = init_choice
+            except CreateProjectError:
+                raise
             except Exception as e: # Handle non-interactive environment
                 print_warning(f"Could not display interactive git prompt ({e}). Defaulting to no git initialization.")
                 print_info("Use --init-git or --no-init-git to explicitly control this.")
                 should_initialize_git = False # Safer default
     else:
-        if args.force_init_git:
+        if options.init_git:
             print_warning("--init-git flag used, but Git command not found. Cannot initialize repository.")
         else:
             print_warning("Git command not found. Skipping git repository initialization.")
 
-    if should_initialize_git:
-        print(f"\n{Colors.BRIGHT_BLUE}{EMOJI_GIT} Initializing a new git repository in '{Colors.YELLOW}{target_dir}{Colors.RESET}{Colors.BRIGHT_BLUE}'...{Colors.RESET}")
-        if execute_command(["git", "init"], cwd=str(target_dir), error_message="Failed to initialize git repository."):
-            print(f"{Colors.BRIGHT_GREEN}{EMOJI_SPARKLES} New git repository initialized.{Colors.RESET}")
-            print_step("Adding files to the new repository...")
-            if execute_command(["git", "add", "."], cwd=str(target_dir), error_message="Failed to add files to git."):
-                print_step("Making initial commit...")
-                initial_commit_message = f"Initial commit: Bootstrap '{project_name}' from ReactTangoTemplate"
-                if execute_command(["git", "commit", "-m", initial_commit_message], cwd=str(target_dir), error_message="Failed to make initial commit."):
-                    print_success(f"Initial commit made: \"{initial_commit_message}\"")
-
-    # --- Enhanced Dependency Installation with More Options ---
-    ran_any_installation = False
+    # --- Dependency Installation Choice ---
     install_choices_made = []
+    if options.install == "none":
+        print(f"\n{Colors.BRIGHT_YELLOW}{EMOJI_SKIP} --skip-all-install flag used. All dependency installations are skipped.{Colors.RESET}")
+    elif options.install == "all":
+        print_step("--install-all flag used: Proceeding with all available installations.")
+        install_choices_made = ["backend", "frontend"]
+    elif options.install in ("backend", "frontend"):
+        install_choices_made = [options.install]
+    else:
+        # The template isn't fetched yet, so every option is offered; a side without a manifest is skipped later.
+        available_install_options = [ # (title, value, checked) for the interactive prompt
+            (f"{EMOJI_ALL} Install All Dependencies (Backend + Frontend)", "all", True),
+            (f"{EMOJI_PYTHON} Backend Only (Python with venv)", "backend", False),
+            (f"{EMOJI_NODE} Frontend Only (Node.js with pnpm)", "frontend", False),
+            (f"{EMOJI_NONE} Install None (Skip all installations)", "none", False),
+        ]
+        try:
+            print(f"\n{Colors.BRIGHT_MAGENTA}{'='*70}{Colors.RESET}")
+            print(f"{Colors.BRIGHT_MAGENTA}{EMOJI_INSTALL} DEPENDENCY INSTALLATION OPTIONS {EMOJI_INSTALL}{Colors.RESET}")
+            print(f"{Colors.BRIGHT_MAGENTA}{'='*70}{Colors.RESET}")
+
+            questionary, custom_style = load_questionary()
+            selected_option = questionary.select(
+                f"{EMOJI_PROMPT} What dependencies would you like to install?",
+                choices=[questionary.Choice(title, value=value, checked=checked)
+                         for title, value, checked in available_install_options],
+                style=custom_style
+            ).ask()
 
-    if not args.skip_all_install: # If user didn't explicitly skip all
-        package_json_exists = (target_dir / "package.json").exists()
-        requirements_txt_exists = (target_dir / "requirements.txt").exists()
-
-        available_install_options = []
-        
-        # Add "Install All" option if both exist
-        if requirements_txt_exists and package_json_exists:
-            available_install_options.append(
-                questionary.Choice(
-                    f"{EMOJI_ALL} Install All Dependencies (Backend + Frontend)", 
-                    value="all", 
-                    checked=True
-                )
-            )
-        
-        # Add individual options
-        if requirements_txt_exists:
-            available_install_options.append(
-                questionary.Choice(
-                    f"{EMOJI_PYTHON} Backend Only (Python with venv)", 
-                    value="backend", 
-                    checked=False if (requirements_txt_exists and package_json_exists) else True
-                )
-            )
-        if package_json_exists:
-            available_install_options.append(
-                questionary.Choice(
-                    f"{EMOJI_NODE} Frontend Only (Node.js with pnpm)", 
-                    value="frontend", 
-                    checked=False if (requirements_txt_exists and package_json_exists) else True
-                )
-            )
-        
-        # Add "Install None" option
-        available_install_options.append(
-            questionary.Choice(
-                f"{EMOJI_NONE} Install None (Skip all installations)", 
-                value="none", 
-                checked=False
-            )
-        )
-
-        if available_install_options:
-            if args.install_all:
-                print_step("--install-all flag used: Proceeding with all available installations.")
-                if requirements_txt_exists:
-                    install_choices_made.append("backend")
-                if package_json_exists:
-                    install_choices_made.append("frontend")
+            if selected_option is None: # User cancelled
+                print(f"\n{Colors.BRIGHT_RED}{EMOJI_CANCEL} Dependency installation cancelled by user.{Colors.RESET}")
+            elif selected_option == "all":
+                install_choices_made = ["backend", "frontend"]
+                print_info(f"Selected: {Colors.BRIGHT_GREEN}Install All Dependencies{Colors.RESET}")
+            elif selected_option == "none":
+                print_info(f"Selected: {Colors.BRIGHT_YELLOW}Skip All Installations{Colors.RESET}")
             else:
-                try:
-                    print(f"\n{Colors.BRIGHT_MAGENTA}{'='*70}{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_MAGENTA}{EMOJI_INSTALL} DEPENDENCY INSTALLATION OPTIONS {EMOJI_INSTALL}{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_MAGENTA}{'='*70}{Colors.RESET}")
-                    
-                    selected_option = questionary.select(
-                        f"{EMOJI_PROMPT} What dependencies would you like to install?",
-                        choices=available_install_options,
-                        style=custom_style
-                    ).ask()
-
-                    if selected_option is None: # User cancelled
-                        print(f"\n{Colors.BRIGHT_RED}{EMOJI_CANCEL} Dependency installation cancelled by user.{Colors.RESET}")
-                        install_choices_made = [] # Ensure it's an empty list
-                    elif selected_option == "all":
-                        if requirements_txt_exists:
-                            install_choices_made.append("backend")
-                        if package_json_exists:
-                            install_choices_made.append("frontend")
-                        print_info(f"Selected: {Colors.BRIGHT_GREEN}Install All Dependencies{Colors.RESET}")
-                    elif selected_option == "none":
-                        install_choices_made = []
-                        print_info(f"Selected: {Colors.BRIGHT_YELLOW}Skip All Installations{Colors.RESET}")
-                    else:
-                        install_choices_made = [selected_option]
-                        option_name = "Backend" if selected_option == "backend" else "Frontend"
-                        print_info(f"Selected: {Colors.BRIGHT_CYAN}{option_name} Only{Colors.RESET}")
-                        
-                except Exception as e:
-                    print_warning(f"Could not display interactive install prompt ({e}). Skipping installations.")
-                    print_info("Use --install-all to force or --skip-all-install to suppress this.")
-                    install_choices_made = []
-
-            if install_choices_made:
-                install_be = "backend" in install_choices_made
-                install_fe = "frontend" in install_choices_made
-                # For backend, always use venv if installing, unless a --no-venv flag is explicitly passed by user
-                # Here, args.with_venv is True by default or set by --with-venv/--no-venv
-                use_venv_for_be = args.with_venv if install_be else False
-
-                if run_project_setup(target_dir, install_be, install_fe, use_venv_for_be):
-                    ran_any_installation = True # Mark that at least one setup was attempted successfully
-            elif not args.install_all : # Only show skip message if not forced by --install-all
-                print(f"\n{Colors.BRIGHT_YELLOW}{EMOJI_SKIP} No dependencies selected for installation.{Colors.RESET}")
+                install_choices_made = [selected_option]
+                option_name = "Backend" if selected_option == "backend" else "Frontend"
+                print_info(f"Selected: {Colors.BRIGHT_CYAN}{option_name} Only{Colors.RESET}")
+        except Exception as e:
+            print_warning(f"Could not display interactive install prompt ({e}). Skipping installations.")
+            print_info("Use --install-all to force or --skip-all-install to suppress this.")
+        if not install_choices_made:
+            print(f"\n{Colors.BRIGHT_YELLOW}{EMOJI_SKIP} No dependencies selected for installation.{Colors.RESET}")
+
+    return should_initialize_git, install_choices_made
+
+def plan_create_steps(options: CreateOptions, target_dir: Path, initialize_git: bool, install_choices) -> list:
+    """
+    Returns the steps that create a project, as a graph for run_step_graph().
+    Git reads the template's files, so the installs, which write venv/ and
+    node_modules/ into the project, wait for the fast bootstrap or, with the
+    classic one, for git add; the commit itself then overlaps with them.
+    The frontend runs after the backend, whether or not it succeeded, unless
+    parallel_install is set.
+    """
+    export_only = not options.full_clone
+
+    def fetch():
+        if local_template_source(options.template) is not None:
+            action, done = "Copying", "copied"
         else:
-            print_info("No dependency manifest files (requirements.txt, package.json) found. Skipping installation phase.")
-    else: # --skip-all-install was used
-        print(f"\n{Colors.BRIGHT_YELLOW}{EMOJI_SKIP} --skip-all-install flag used. All dependency installations are skipped.{Colors.RESET}")
+            action, done = ("Exporting", "exported") if export_only else ("Cloning", "cloned")
+        print(f"{Colors.BRIGHT_CYAN}{EMOJI_CLONE} {action} ReactTangoTemplate into '{Colors.YELLOW}{options.project_name}{Colors.RESET}{Colors.BRIGHT_CYAN}'...{Colors.RESET}")
+        # The project directory must not exist before the fetch, so its commands can't be logged there.
+        with profile_phase("fetch template"), command_output_settings(None, quiet=options.quiet_install):
+            fetched = fetch_template(options.template, options.branch, target_dir,
+                                     use_cache=options.use_template_cache, offline=options.offline or options.template_prefetched,
+                                     force_refresh=options.refresh_template, export=export_only)
+        if not fetched:
+            return False
+        print_success(f"Template {done} successfully into '{Colors.YELLOW}{target_dir}{Colors.RESET}'.")
+        project_state_dir(target_dir) # Holds the create journal and logs
+        return True
+
+    def remove_template_git():
+        git_dir_path = target_dir / ".git"
+        if git_dir_path.exists() and git_dir_path.is_dir():
+            print_step("Removing template's .git directory...")
+            try:
+                with profile_phase("remove template .git"):
+                    shutil.rmtree(git_dir_path)
+                print(f"{Colors.BRIGHT_GREEN}{EMOJI_SPARKLES} Template .git directory removed.{Colors.RESET}")
+            except OSError as e:
+                print_warning(f"Could not remove .git directory: {e}. Please remove it manually.")
+                return False
+        else:
+            print_warning("Template .git directory not found after clone. Skipping removal.")
+        return True
+
+    def install_backend():
+        return install_backend_dependencies(target_dir, options.with_venv, use_venv_cache=options.use_venv_cache,
+                                            py_installer=options.py_installer, wheelhouse=options.wheelhouse)
+
+    def install_frontend():
+        return install_frontend_dependencies(target_dir, use_shared_store=options.use_shared_store, offline=options.offline)
+
+    def precompile():
+        with profile_phase("precompile bytecode"):
+            return precompile_backend(target_dir, options.with_venv)
+
+    def dedupe():
+        with profile_phase("dedupe"):
+            if dedupe_paths([target_dir], DedupeStore(Path(options.dedupe_store)), mode=options.dedupe_mode) is None:
+                print_warning("The project was created but not deduplicated. Run 'reactango dedupe' to retry.")
+        return True # Only saves space; the project is complete either way
+
+    def substitute():
+        variables = placeholder_variables(options.project_name, options.backend_port, options.frontend_port)
+        with profile_phase("substitute placeholders"):
+            return substitute_placeholders(target_dir, variables)
+
+    steps = [Step("fetch", fetch, outputs=(".", ".reactango"), estimate=2.0, color=Colors.BRIGHT_CYAN)]
+    tree_ready = ("fetch",)
+    if not export_only: # An export never writes the template's history, so there is nothing to remove.
+        steps.append(Step("remove-template-git", remove_template_git, requires=("fetch",), outputs=(".git",), estimate=0.2,
+                          color=Colors.BRIGHT_CYAN))
+        tree_ready = ("remove-template-git",)
+    # Placeholders are filled in before git commits the files and before pnpm reads package.json.
+    steps.append(Step("substitute", substitute, requires=tree_ready, estimate=0.2, color=Colors.BRIGHT_CYAN))
+    tree_ready = ("substitute",)
+    if initialize_git and options.git_bootstrap == "fast":
+        steps.append(Step("git", lambda: git_fast_bootstrap(target_dir, options.project_name), requires=tree_ready,
+                          inputs=(".",), outputs=(".git",), estimate=0.5, color=Colors.BRIGHT_BLUE))
+        tree_ready = ("git",)
+    elif initialize_git:
+        steps += [
+            Step("git-init", lambda: git_init_repository(target_dir), requires=tree_ready, outputs=(".git",),
+                 estimate=0.1, color=Colors.BRIGHT_BLUE),
+            Step("git-add", lambda: git_add_all(target_dir), requires=("git-init",), inputs=(".",), outputs=(".git/index",),
+                 estimate=0.5, color=Colors.BRIGHT_BLUE),
+            Step("git-commit", lambda: git_commit_initial(target_dir, options.project_name), requires=("git-add",),
+                 inputs=(".git/index",), outputs=(".git",), estimate=0.3, color=Colors.BRIGHT_BLUE),
+        ]
+        tree_ready = ("git-add",)
+    if "backend" in install_choices:
+        steps.append(Step("backend", install_backend, requires=tree_ready, inputs=("requirements.txt",), outputs=("venv",),
+                          estimate=30.0, color=Colors.BRIGHT_MAGENTA))
+    if "frontend" in install_choices:
+        # Without parallel_install the frontend waits for the backend, but is still installed if the backend failed.
+        frontend_after = ("backend",) if "backend" in install_choices and not options.parallel_install else ()
+        steps.append(Step("frontend", install_frontend, requires=tree_ready, after=frontend_after,
+                          inputs=("package.json", "pnpm-lock.yaml"), outputs=("node_modules",), estimate=20.0,
+                          color=Colors.BRIGHT_GREEN))
+    if "backend" in install_choices and options.precompile:
+        # Needs only the finished venv, so it overlaps with the frontend install.
+        steps.append(Step("precompile", precompile, requires=("backend",), inputs=("requirements.txt",), estimate=5.0,
+                          color=Colors.BRIGHT_MAGENTA))
+    if options.dedupe_store:
+        # Last, so that it sees every file the other steps wrote.
+        steps.append(Step("dedupe", dedupe, requires=tuple(step.name for step in steps), estimate=2.0, color=Colors.DIM))
+    return steps
+
+def create_project(options: CreateOptions) -> bool:
+    """
+    Creates a project from the template as described by options.
+    Returns True if every requested dependency installation succeeded.
+    Raises CreateProjectError if the project could not be created.
+    """
+    target_dir = Path(options.directory or options.project_name).resolve()
+
+    if target_dir.exists():
+        print_error(f"Directory '{target_dir}' already exists. Please choose a different name or remove the existing directory.")
+        if (target_dir / ".reactango" / "state.json").exists():
+            print_info(f"To finish an earlier attempt, run: {Colors.CYAN}reactango resume {target_dir}{Colors.RESET}")
+        raise CreateProjectError(f"Directory '{target_dir}' already exists.")
+
+    if options.offline and not options.use_template_cache:
+        print_error("--offline needs the template cache. Drop --no-template-cache.")
+        raise CreateProjectError("--offline needs the template cache.")
+
+    should_initialize_git, install_choices_made = resolve_create_choices(options)
+    ensure_toolchain(options, should_initialize_git, install_choices_made)
+    return _run_create_steps(options, target_dir, should_initialize_git, install_choices_made, CreateJournal(target_dir))
+
+def resume_project(project_path: Path, **overrides) -> bool:
+    """
+    Continues a create that stopped in project_path, re-running only the steps
+    that did not finish or whose inputs changed since, and everything after them.
+    overrides replace settings of the original run (e.g. jobs, offline).
+    Returns True if every requested dependency installation succeeded.
+    Raises CreateProjectError if the project can't be resumed.
+    """
+    project_path = project_path.resolve()
+    try:
+        journal = CreateJournal.load(project_path)
+        options = journal.create_options(**overrides)
+    except (ValueError, TypeError, KeyError) as e:
+        print_error(f"Cannot resume '{project_path}': {e}")
+        raise CreateProjectError(str(e))
+    ensure_toolchain(options, journal.state["initialize_git"], journal.state["install_choices"])
+    return _run_create_steps(options, project_path, journal.state["initialize_git"], journal.state["install_choices"],
+                             journal, resuming=True)
+
+def _run_create_steps(options: CreateOptions, target_dir: Path, should_initialize_git: bool, install_choices_made,
+                      journal: CreateJournal, resuming=False) -> bool:
+    """Runs (or, when resuming, finishes) the steps of a create and prints the outcome."""
+    project_name = options.project_name
+    steps = plan_create_steps(options, target_dir, should_initialize_git, install_choices_made)
+    completed = set()
+    if resuming:
+        completed = journal.completed_steps(steps)
+        remaining = [step.name for step in order_steps(steps) if step.name not in completed]
+        if not remaining:
+            print_success(f"Every step of '{Colors.YELLOW}{project_name}{Colors.RESET}' already finished. Nothing to resume.")
+            return True
+        print_info(f"Already done: {', '.join(sorted(completed)) or 'nothing'}. Running: {', '.join(remaining)}.")
+
+    def on_success(step):
+        if step.name == "fetch":
+            journal.start(options, should_initialize_git, install_choices_made)
+        journal.record(step)
+        if step.name in ("backend", "frontend"): # Lets an immediate 'reactango sync' skip what was just installed
+            record_sync_fingerprint(target_dir, step.name, options.with_venv)
+
+    log_path = target_dir / ".reactango" / "logs" / "create.log" if options.install_log else None
+    with command_output_settings(log_path, quiet=options.quiet_install):
+        status = run_step_graph(steps, jobs=options.jobs, completed=completed, on_success=on_success)
+
+    if status.get("fetch") != "ok":
+        raise CreateProjectError("Failed to fetch the template.")
+
+    for side in ("backend", "frontend"):
+        if side not in install_choices_made:
+            continue
+        if status.get(side) == "ok":
+            print_success(f"{side.capitalize()} installation completed successfully!")
+        elif status.get(side) == "skipped":
+            print_warning(f"{side.capitalize()} dependency installation was skipped because an earlier step failed.")
+        else:
+            print_error(f"{side.capitalize()} dependency installation failed.")
+    install_status = [status.get(name) for name in ("backend", "frontend") if name in install_choices_made]
+    installs_ok = all(result == "ok" for result in install_status)
+    ran_any_installation = bool(install_status) and installs_ok
+    if ran_any_installation:
+        print(f"\n{Colors.BRIGHT_GREEN}{'='*70}{Colors.RESET}")
+        print_party(f"ALL DEPENDENCY INSTALLATIONS COMPLETED SUCCESSFULLY! {EMOJI_SPARKLES}")
+        print(f"{Colors.BRIGHT_GREEN}{'='*70}{Colors.RESET}")
+    elif not installs_ok:
+        print(f"\n{Colors.BRIGHT_YELLOW}{'='*70}{Colors.RESET}")
+        print_warning("Dependency installation completed with some issues. Please review the logs above.")
+        print_info(f"Once fixed, retry only what failed with: {Colors.CYAN}reactango resume {target_dir}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_YELLOW}{'='*70}{Colors.RESET}")
 
     # Final success message with enhanced styling
     print(f"\n{Colors.BRIGHT_GREEN}{'='*70}{Colors.RESET}")
@@ -444,13 +3064,13 @@ def handle_create_project(args):
     print(f"\n{Colors.BRIGHT_BLUE}{EMOJI_NEXT_STEPS} NEXT STEPS:{Colors.RESET}")
     print(f"  {Colors.BRIGHT_CYAN}1.{Colors.RESET} {Colors.YELLOW}cd {project_name}{Colors.RESET}")
 
-    if not ran_any_installation and not args.skip_all_install:
+    if not ran_any_installation and options.install != "none":
         print(f"  {Colors.BRIGHT_CYAN}2.{Colors.RESET} {Colors.BRIGHT_BLUE}{EMOJI_GEAR} Install dependencies manually if needed:{Colors.RESET}")
         if (target_dir / "requirements.txt").exists() and "backend" not in install_choices_made:
              print(f"     {Colors.BRIGHT_MAGENTA}{EMOJI_PYTHON} Backend:{Colors.RESET} {Colors.CYAN}python3 -m venv venv && source venv/bin/activate && pip install -r requirements.txt{Colors.RESET}")
         if (target_dir / "package.json").exists() and "frontend" not in install_choices_made:
              print(f"     {Colors.BRIGHT_GREEN}{EMOJI_NODE} Frontend:{Colors.RESET} {Colors.CYAN}pnpm install{Colors.RESET}")
-    elif args.with_venv and "backend" in install_choices_made:
+    elif options.with_venv and "backend" in install_choices_made:
         activate_cmd_rel = f"venv/Scripts/activate" if os.name == 'nt' else "venv/bin/activate"
         print(f"  {Colors.BRIGHT_CYAN}2.{Colors.RESET} {Colors.BRIGHT_MAGENTA}{EMOJI_PYTHON} Activate Python virtual environment:{Colors.RESET} {Colors.CYAN}source {activate_cmd_rel}{Colors.RESET}")
         print(f"  {Colors.BRIGHT_CYAN}3.{Colors.RESET} {Colors.BRIGHT_GREEN}{EMOJI_ROCKET} Start development server:{Colors.RESET} {Colors.CYAN}pnpm run dev{Colors.RESET}")
@@ -459,8 +3079,387 @@ def handle_create_project(args):
 
     print(f"\n  {Colors.DIM}For more details, check the README.md inside your new project.{Colors.RESET}")
     print(f"\n{Colors.BRIGHT_YELLOW}{EMOJI_SPARKLES} Happy coding! {EMOJI_SPARKLES}{Colors.RESET}")
+    return installs_ok
 
-def main():
+def resolve_template_argument(template: str) -> str:
+    """Makes a local template path absolute, so that 'resume' finds it from any directory."""
+    local_source = local_template_source(template)
+    return str(local_source) if local_source is not None else template
+
+def create_options_from_args(args) -> CreateOptions:
+    """Translates parsed 'create' arguments into CreateOptions."""
+    init_git = True if args.force_init_git else (False if args.force_no_init_git else None)
+    install = "all" if args.install_all else ("none" if args.skip_all_install else None)
+    return CreateOptions(
+        project_name=args.project_name,
+        branch=args.branch,
+        template=resolve_template_argument(args.template),
+        offline=args.offline,
+        refresh_template=args.refresh_template,
+        use_template_cache=not args.no_template_cache,
+        full_clone=args.full_clone,
+        init_git=init_git,
+        install=install,
+        with_venv=args.with_venv,
+        use_venv_cache=not args.no_venv_cache,
+        parallel_install=args.parallel_install,
+        py_installer=args.py_installer,
+        wheelhouse=args.wheelhouse,
+        use_shared_store=not args.no_shared_store,
+        quiet_install=args.quiet_install,
+        install_log=args.install_log,
+        jobs=1 if args.serial else max(1, args.jobs),
+        git_bootstrap=args.git_bootstrap,
+        precompile=args.precompile,
+        backend_port=args.backend_port,
+        frontend_port=args.frontend_port,
+        dedupe_store=str(Path(args.dedupe_store).expanduser().resolve()) if args.dedupe_store else None,
+        dedupe_mode=args.dedupe_mode,
+    )
+
+def handle_create_project(args):
+    """Handles the logic for the 'create' subcommand."""
+    if args.plan:
+        options = create_options_from_args(args)
+        # Nothing is asked when only planning; assume the prompts' defaults.
+        options = options._replace(init_git=True if options.init_git is None else options.init_git,
+                                   install=options.install or "all")
+        install_choices = {"all": ["backend", "frontend"], "none": []}.get(options.install, [options.install])
+        target_dir = Path(options.directory or options.project_name).resolve()
+        print_step_plan(plan_create_steps(options, target_dir, options.init_git, install_choices), options.jobs)
+        return
+
+    profiler.enabled = bool(args.profile or args.timings)
+    try:
+        with profile_phase("create"):
+            create_project(create_options_from_args(args))
+    except CreateProjectError as e:
+        sys.exit(e.exit_code)
+    finally:
+        if args.timings:
+            profiler.print_summary()
+        if args.profile:
+            try:
+                profiler.write_chrome_trace(args.profile)
+                print_info(f"Trace written to '{Colors.YELLOW}{args.profile}{Colors.RESET}'. Open it in chrome://tracing or https://ui.perfetto.dev.")
+            except OSError as e:
+                print_warning(f"Could not write trace to '{args.profile}': {e}")
+
+def handle_resume(args):
+    """Handles the logic for the 'resume' subcommand."""
+    overrides = {"jobs": 1 if args.serial else max(1, args.jobs), "quiet_install": args.quiet_install}
+    if args.offline:
+        overrides["offline"] = True
+    try:
+        if not resume_project(Path(args.directory), **overrides):
+            sys.exit(1)
+    except CreateProjectError as e:
+        sys.exit(e.exit_code)
+
+def handle_sync(args):
+    """Handles the logic for the 'sync' subcommand."""
+    project_path = Path(args.directory).resolve()
+    if not project_path.is_dir():
+        print_error(f"Directory '{project_path}' does not exist.")
+        sys.exit(1)
+    sides = ("backend",) if args.backend_only else (("frontend",) if args.frontend_only else ("backend", "frontend"))
+    started_at = time.monotonic()
+    if not sync_project(project_path, sides, force=args.force, py_installer=args.py_installer,
+                        use_shared_store=not args.no_shared_store, offline=args.offline):
+        print_error("Some dependencies could not be brought up to date. Please review the logs above.")
+        sys.exit(1)
+    print_info(f"Synced in {time.monotonic() - started_at:.2f}s.")
+
+# --- Batch Creation ---
+BATCH_PROJECT_KEYS = {
+    "name", "directory", "branch", "template", "full_clone", "init_git", "install",
+    "with_venv", "parallel_install", "py_installer", "wheelhouse", "precompile", "backend_port", "frontend_port",
+}
+BATCH_INSTALL_CHOICES = ("all", "backend", "frontend", "none")
+
+def load_batch_manifest(manifest_path: Path):
+    """
+    Reads a JSON or TOML batch manifest and returns one dict per project,
+    with the manifest's "defaults" table merged in. Raises ValueError if it is malformed.
+    """
+    import json
+    raw = manifest_path.read_bytes()
+    if manifest_path.suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError("TOML manifests need Python 3.11+ or the 'tomli' package. Use a JSON manifest instead.")
+        data = tomllib.loads(raw.decode("utf-8"))
+    else:
+        data = json.loads(raw.decode("utf-8"))
+
+    if not isinstance(data, dict) or not isinstance(data.get("projects"), list):
+        raise ValueError("The manifest needs a 'projects' list.")
+    defaults = data.get("defaults", {})
+    entries = []
+    for index, project in enumerate(data["projects"]):
+        if isinstance(project, str):
+            project = {"name": project}
+        entry = dict(defaults, **project)
+        unknown_keys = set(entry) - BATCH_PROJECT_KEYS
+        if unknown_keys:
+            raise ValueError(f"Project #{index + 1} has unknown keys: {', '.join(sorted(unknown_keys))}")
+        if not entry.get("name"):
+            raise ValueError(f"Project #{index + 1} has no 'name'.")
+        if entry.get("install", "all") not in BATCH_INSTALL_CHOICES:
+            raise ValueError(f"Project '{entry['name']}' has an invalid 'install' value. Use one of: {', '.join(BATCH_INSTALL_CHOICES)}.")
+        entries.append(entry)
+    names = [entry["name"] for entry in entries]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate project names: {', '.join(duplicates)}")
+    return entries
+
+def _create_batch_project(options: CreateOptions):
+    """Process pool worker: creates one project and returns (name, status, seconds)."""
+    started_at = time.monotonic()
+    try:
+        with prefixed_output():
+            installs_ok = run_in_phase(options.project_name, run_with_output_prefix,
+                                       f"{Colors.BRIGHT_BLUE}[{options.project_name}]{Colors.RESET}", create_project, options)
+        status = "ok" if installs_ok else "install failed"
+    except CreateProjectError as e:
+        status = f"failed: {e}"
+    except Exception as e: # Keep one broken project from taking down the whole batch
+        status = f"error: {e}"
+    return options.project_name, status, time.monotonic() - started_at
+
+def handle_create_batch(args):
+    """Handles the logic for the 'create-batch' subcommand."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    manifest_path = Path(args.manifest)
+    try:
+        entries = load_batch_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        print_error(f"Could not read manifest '{manifest_path}': {e}")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir).resolve()
+    all_options = []
+    for entry in entries:
+        all_options.append(CreateOptions(
+            project_name=entry["name"],
+            directory=output_dir / entry.get("directory", entry["name"]),
+            branch=entry.get("branch"),
+            template=resolve_template_argument(entry.get("template", args.template)),
+            offline=args.offline,
+            use_template_cache=not args.no_template_cache,
+            template_prefetched=not args.no_template_cache,
+            full_clone=entry.get("full_clone", False),
+            init_git=entry.get("init_git", True),
+            install=entry.get("install", "all"),
+            with_venv=entry.get("with_venv", True),
+            use_venv_cache=not args.no_venv_cache,
+            parallel_install=entry.get("parallel_install", False),
+            py_installer=entry.get("py_installer", "auto"),
+            wheelhouse=entry.get("wheelhouse"),
+            precompile=entry.get("precompile", True),
+            backend_port=entry.get("backend_port", 8000),
+            frontend_port=entry.get("frontend_port", 5173),
+            use_shared_store=not args.no_shared_store,
+            dedupe_store=str(Path(args.dedupe_store).expanduser().resolve()) if args.dedupe_store else None,
+            dedupe_mode=args.dedupe_mode,
+        ))
+
+    # Every project checks out of the same cached template, so fetch each template once up front.
+    if not args.no_template_cache:
+        for template in sorted({options.template for options in all_options}):
+            if local_template_source(template) is not None:
+                continue # Copied straight from disk by every project
+            if update_template_mirror(template, offline=args.offline, force_refresh=args.refresh_template) is None:
+                sys.exit(1)
+
+    jobs = max(1, args.jobs)
+    print_step(f"Creating {len(all_options)} project(s) with up to {jobs} at a time...")
+    started_at = time.monotonic()
+    results = []
+    # Workers started with 'spawn' (macOS, Windows) don't inherit ndjson mode, so it is set up again in each.
+    worker_setup = {"initializer": enable_event_output, "initargs": (event_sink.fd,)} if event_sink is not None else {}
+    with ProcessPoolExecutor(max_workers=jobs, **worker_setup) as executor:
+        futures = [executor.submit(_create_batch_project, options) for options in all_options]
+        for future in as_completed(futures):
+            results.append(future.result())
+    elapsed = time.monotonic() - started_at
+
+    order = {options.project_name: index for index, options in enumerate(all_options)}
+    results.sort(key=lambda result: order[result[0]])
+    name_width = max([len("PROJECT")] + [len(name) for name, _, _ in results]) + 2
+    if event_sink is None:
+        print(f"\n{Colors.BOLD}{'PROJECT':<{name_width}}{'TIME':>9}  STATUS{Colors.RESET}")
+    for name, status, seconds in results:
+        if event_sink is not None:
+            event_sink.emit("project.result", "info" if status == "ok" else "error", project=name, status=status,
+                            duration=round(seconds, 3))
+            continue
+        color = Colors.BRIGHT_GREEN if status == "ok" else Colors.BRIGHT_RED
+        print(f"{name:<{name_width}}{seconds:>8.1f}s  {color}{status}{Colors.RESET}")
+
+    failures = sum(1 for _, status, _ in results if status != "ok")
+    if failures:
+        print_warning(f"{len(results) - failures} of {len(results)} project(s) created cleanly in {elapsed:.1f}s; {failures} had problems.")
+        sys.exit(1)
+    print_party(f"All {len(results)} project(s) created in {elapsed:.1f}s!")
+
+def handle_warm(args):
+    """Handles the logic for the 'warm' subcommand."""
+    import tempfile
+
+    if not command_exists("pnpm"):
+        print_error("pnpm is not installed or not in PATH. Please install pnpm.")
+        sys.exit(1)
+
+    scratch_dir = Path(tempfile.mkdtemp(prefix="reactango-warm-"))
+    try:
+        template_dir = scratch_dir / "template"
+        if not fetch_template(args.template, args.branch, template_dir, force_refresh=args.refresh_template):
+            sys.exit(1)
+        if not (template_dir / "pnpm-lock.yaml").exists():
+            print_warning("The template has no 'pnpm-lock.yaml'. Nothing to prefetch.")
+            return
+        store_dir = get_pnpm_store_dir()
+        print_step(f"Prefetching frontend dependencies into '{Colors.YELLOW}{store_dir}{Colors.RESET}'...")
+        if not execute_command(["pnpm", "fetch", "--store-dir", str(store_dir)], cwd=str(template_dir),
+                               error_message="Failed to prefetch frontend dependencies."):
+            sys.exit(1)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    print_success("Store warmed. 'reactango create --offline' can now install the frontend without network access.")
+
+def handle_doctor(args):
+    """Handles the logic for the 'doctor' subcommand."""
+    import json
+    tools, from_cache = probe_toolchain(refresh=args.refresh)
+    # What a default 'create --install-all' needs.
+    problems = toolchain_problems(tools, toolchain_requirements(CreateOptions(project_name=""), True, ["backend", "frontend"]))
+    if args.json or event_sink is not None:
+        report = {
+            "ok": not problems,
+            "cached": from_cache,
+            "problems": problems,
+            "tools": {name: {"path": tool.path, "version": tool.version, "ok": tool.ok,
+                             "minimum": ".".join(str(part) for part in tool.minimum) if tool.minimum else None}
+                      for name, tool in tools.items()},
+        }
+        if event_sink is not None:
+            event_sink.emit("doctor.report", "info" if not problems else "error", **report)
+        else:
+            print(json.dumps(report, indent=2))
+    else:
+        print(f"{Colors.BOLD}{'TOOL':<10}{'VERSION':<12}{'MINIMUM':<10}PATH{Colors.RESET}")
+        for tool in tools.values():
+            minimum = ".".join(str(part) for part in tool.minimum) if tool.minimum else "-"
+            color = Colors.RESET if tool.ok else (Colors.DIM if tool.path is None else Colors.BRIGHT_RED)
+            print(f"{color}{tool.name:<10}{tool.version or '-':<12}{minimum:<10}{tool.path or 'not found'}{Colors.RESET}")
+        if from_cache:
+            print(f"{Colors.DIM}Versions from cache; use --refresh to re-run every tool.{Colors.RESET}")
+        for problem in problems:
+            print_error(problem)
+        if not problems:
+            print_success("Everything 'reactango create --install-all' needs is installed.")
+    if problems:
+        sys.exit(1)
+
+def print_known_template_versions(repo_url: str):
+    """Lists the branches and tags the template index knows for repo_url, as a hint after a bad --branch."""
+    entry = load_template_index()["templates"].get(repo_url)
+    if entry:
+        names = sorted(entry.get("branches", {})) + sorted(entry.get("tags", {}))
+        print_info(f"Known branches and tags: {', '.join(names)}. See {Colors.CYAN}reactango templates list{Colors.RESET}.")
+
+def handle_templates(args):
+    """Handles the logic for the 'templates' subcommand."""
+    import json
+    if args.templates_command == "refresh":
+        urls = args.urls or sorted(load_template_index()["templates"]) or [TEMPLATE_REPO_URL]
+        failed = [url for url in urls if update_template_mirror(url, force_refresh=args.force) is None]
+        if failed:
+            print_error(f"Could not refresh: {', '.join(failed)}")
+            sys.exit(1)
+        print_success(f"Refreshed {len(urls)} template(s).")
+        return
+
+    templates = load_template_index()["templates"]
+    if args.json:
+        print(json.dumps(templates, indent=2, sort_keys=True))
+        return
+    if not templates:
+        print_info(f"No templates cached yet. Run {Colors.CYAN}reactango templates refresh{Colors.RESET} or create a project first.")
+        return
+    ttl_seconds = template_cache_ttl_seconds()
+    for url, entry in sorted(templates.items()):
+        age = time.time() - entry.get("fetched_at", 0)
+        stale = f" {Colors.BRIGHT_YELLOW}(stale){Colors.RESET}" if age > ttl_seconds else ""
+        print(f"\n{Colors.BOLD}{url}{Colors.RESET}  {Colors.DIM}fetched {format_duration(age)} ago{Colors.RESET}{stale}")
+        print(f"{Colors.BOLD}  {'REF':<32}{'COMMIT':<10}TREE{Colors.RESET}")
+        versions = [(name, "branch", version) for name, version in sorted(entry.get("branches", {}).items())]
+        versions += [(name, "tag", version) for name, version in sorted(entry.get("tags", {}).items())]
+        for name, kind, version in versions:
+            label = f"{name} (default)" if kind == "branch" and name == entry.get("default_branch") else (
+                name if kind == "branch" else f"tag: {name}")
+            print(f"  {label:<32}{(version.get('commit') or '-')[:8]:<10}{(version.get('tree') or '-')[:12]}")
+
+def handle_venv_cache(args):
+    """Handles the logic for the 'venv-cache' subcommand."""
+    if args.venv_cache_command == "list":
+        entries = list_venv_cache()
+        if not entries:
+            print_info(f"The virtual environment cache at '{Colors.YELLOW}{get_venv_cache_dir()}{Colors.RESET}' is empty.")
+            return
+        print(f"{Colors.BOLD}{'KEY':<14}{'PYTHON':<10}{'PLATFORM':<24}{'SIZE':>10}  LAST USED{Colors.RESET}")
+        for meta in entries:
+            last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime(meta.get("last_used", 0)))
+            print(f"{meta['key'][:12]:<14}{meta.get('python_version', '?'):<10}{meta.get('platform', '?'):<24}"
+                  f"{format_size(meta.get('size_bytes', 0)):>10}  {last_used}")
+        total_size = sum(meta.get("size_bytes", 0) for meta in entries)
+        print_info(f"{len(entries)} cached environment(s), {format_size(total_size)} in total.")
+        return
+
+    if args.venv_cache_command == "prune":
+        try:
+            max_size_bytes = parse_size(args.max_size)
+        except ValueError as e:
+            print_error(str(e))
+            sys.exit(1)
+    else: # clear
+        max_size_bytes = -1
+    removed, bytes_freed = prune_venv_cache(max_size_bytes)
+    print_success(f"Removed {removed} cached environment(s), freeing {format_size(bytes_freed)}.")
+
+def handle_dedupe(args):
+    """Handles the logic for the 'dedupe' subcommand."""
+    try:
+        min_size = parse_size(args.min_size)
+    except ValueError as e:
+        print_error(str(e))
+        sys.exit(1)
+    if not args.paths and not args.prune:
+        print_error("Give at least one project directory to deduplicate, or --prune.")
+        sys.exit(1)
+    missing = [path for path in args.paths if not Path(path).is_dir()]
+    if missing:
+        print_error(f"Not a directory: {', '.join(missing)}")
+        sys.exit(1)
+    store = DedupeStore(Path(args.store))
+    if args.paths:
+        report = dedupe_paths([Path(path).resolve() for path in args.paths], store, mode=args.mode, min_size=min_size)
+        if report is None:
+            sys.exit(1)
+        if event_sink is not None:
+            event_sink.emit("dedupe.report", **{key.replace(" ", "_"): value for key, value in report.items()})
+    if args.prune:
+        removed, bytes_freed = prune_dedupe_store(store)
+        print_success(f"Removed {removed} unused object(s) from the store, freeing {format_size(bytes_freed)}.")
+
+def print_banner():
     banner = f"""{Colors.BRIGHT_CYAN}
 ╔═══════════════════════════════════════════════════════╗
 ║                 {Colors.BRIGHT_YELLOW}React Tango CLI{Colors.BRIGHT_CYAN}                       ║
@@ -470,6 +3469,7 @@ def main():
 """
     print(banner)
 
+def main():
     parser = argparse.ArgumentParser(
         description=f"{EMOJI_ROCKET} ReactTango CLI - Create and manage ReactTango projects.",
         formatter_class=argparse.RawTextHelpFormatter
@@ -480,6 +3480,20 @@ def main():
         version=f'%(prog)s {__version__}'
     )
 
+    parser.add_argument(
+        "--output",
+        choices=["text", "ndjson"],
+        default="text",
+        help="'ndjson' replaces all output with one JSON event per line (messages, phases, subprocesses), without colours or banner.",
+    )
+    parser.add_argument(
+        "--event-fd",
+        type=int,
+        metavar="FD",
+        default=1,
+        help="File descriptor the ndjson events are written to (default: 1, stdout).",
+    )
+
     subparsers = parser.add_subparsers(dest="command", title="Available commands", help="Run 'reactango <command> --help' for more information.")
     subparsers.required = True
 
@@ -497,6 +3511,33 @@ def main():
         help="Specify a branch of the template to clone (e.g., 'main', 'develop'). Defaults to the default branch.",
         default=None
     )
+    parser_create.add_argument(
+        "--template",
+        help="Git URL, local directory or tarball of the template (default: the official ReactTangoTemplate).",
+        default=TEMPLATE_REPO_URL
+    )
+
+    # --- Template Cache Flags ---
+    parser_create.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never contact the network: use the cached template and the shared pnpm store only.",
+    )
+    parser_create.add_argument(
+        "--refresh-template",
+        action="store_true",
+        help="Fetch template updates even if the cached copy is still fresh.",
+    )
+    parser_create.add_argument(
+        "--no-template-cache",
+        action="store_true",
+        help="Fetch the template directly from the remote without using the local cache.",
+    )
+    parser_create.add_argument(
+        "--full-clone",
+        action="store_true",
+        help="Clone the template with its history and delete .git afterwards instead of exporting only its files.",
+    )
 
     # --- Git Initialization Flags ---
     git_group_create = parser_create.add_mutually_exclusive_group()
@@ -512,6 +3553,25 @@ def main():
         help="Force skipping git initialization.",
         dest="force_no_init_git"
     )
+    parser_create.add_argument(
+        "--git-bootstrap",
+        choices=["fast", "classic"],
+        default="fast",
+        help="How the initial commit is made: 'fast' streams the files into git fast-import in one pass, "
+             "'classic' runs git init/add/commit (default: %(default)s).",
+    )
+    parser_create.add_argument(
+        "--backend-port",
+        type=int,
+        default=8000,
+        help="Port filled in for the template's __BACKEND_PORT__ placeholder (default: %(default)s).",
+    )
+    parser_create.add_argument(
+        "--frontend-port",
+        type=int,
+        default=5173,
+        help="Port filled in for the template's __FRONTEND_PORT__ placeholder (default: %(default)s).",
+    )
 
     # --- Enhanced Dependency Installation Flags ---
     install_group = parser_create.add_mutually_exclusive_group()
@@ -531,6 +3591,11 @@ def main():
         help="Explicitly skip all dependency installations (same as --skip-all-install).",
         dest="skip_all_install"
     )
+    parser_create.add_argument(
+        "--parallel-install",
+        action="store_true",
+        help="Install backend and frontend dependencies at the same time.",
+    )
     
     # Venv for backend (only relevant if backend is installed)
     # Default is True if backend dependencies are installed.
@@ -546,15 +3611,386 @@ def main():
         dest="with_venv",
         help="Do not use a Python virtual environment for backend.",
     )
+    precompile_group = parser_create.add_mutually_exclusive_group()
+    precompile_group.add_argument(
+        "--precompile",
+        action="store_true",
+        default=True,
+        help="Byte-compile the venv and the project's Python code on all cores after the backend install (default).",
+    )
+    precompile_group.add_argument(
+        "--no-precompile",
+        action="store_false",
+        dest="precompile",
+        help="Leave bytecode to be compiled on first import.",
+    )
+    parser_create.add_argument(
+        "--no-venv-cache",
+        action="store_true",
+        help="Always build the virtual environment from scratch instead of reusing a cached one.",
+    )
+    parser_create.add_argument(
+        "--py-installer",
+        choices=sorted(PYTHON_INSTALLERS) + ["auto"],
+        default="auto",
+        help="Tool used to install Python packages. 'auto' uses uv when available, otherwise pip (default: auto).",
+    )
+    parser_create.add_argument(
+        "--wheelhouse",
+        metavar="DIR",
+        default=None,
+        help="Install Python packages only from the wheels in DIR, without contacting a package index.",
+    )
+    parser_create.add_argument(
+        "--no-shared-store",
+        action="store_true",
+        help="Let pnpm use its own default store instead of reactango's shared store.",
+    )
+    parser_create.add_argument(
+        "--quiet-install",
+        action="store_true",
+        help="Show a single live progress line per command instead of its full output; the last lines are printed if it fails.",
+    )
+    parser_create.add_argument(
+        "--install-log",
+        action="store_true",
+        help="Save the full output of every command to .reactango/logs/create.log in the project (rotated at 5 MB).",
+    )
+    parser_create.add_argument(
+        "--dedupe-store",
+        metavar="PATH",
+        default=None,
+        help="Finally replace files identical to ones in other projects with links into this content-addressed store (same filesystem).",
+    )
+    parser_create.add_argument(
+        "--dedupe-mode",
+        choices=DEDUPE_MODES,
+        default="auto",
+        help="How files are shared with the dedupe store: 'reflink' (copy-on-write clones), 'hardlink' (read-only shared files) "
+             "or 'auto', which clones where the filesystem can and otherwise hardlinks only venv/ and node_modules/ (default: auto).",
+    )
+
+    # --- Scheduling Flags ---
+    parser_create.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Maximum number of steps (git, backend, frontend, ...) to run at the same time (default: %(default)s).",
+    )
+    parser_create.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run one step at a time, in dependency order, without tagging output. Useful for debugging.",
+    )
+    parser_create.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print the steps, their dependencies and the critical path, then exit without creating anything.",
+    )
+
+    # --- Profiling Flags ---
+    parser_create.add_argument(
+        "--profile",
+        metavar="FILE",
+        default=None,
+        help="Write a Chrome trace (JSON) with a span for every phase and subprocess to FILE.",
+    )
+    parser_create.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print a table of phase and subprocess timings at the end.",
+    )
 
     parser_create.set_defaults(func=handle_create_project)
 
+    parser_resume = subparsers.add_parser(
+        "resume",
+        help="Finish a project whose 'create' failed part way, without redoing completed steps.",
+        description="Reads the project's .reactango/state.json and re-runs the steps that did not finish or whose inputs changed."
+    )
+    parser_resume.add_argument(
+        "directory",
+        help="Directory of the project to finish.",
+    )
+    parser_resume.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Maximum number of steps to run at the same time (default: %(default)s).",
+    )
+    parser_resume.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run one step at a time, in dependency order.",
+    )
+    parser_resume.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never contact the network, even if the original run was allowed to.",
+    )
+    parser_resume.add_argument(
+        "--quiet-install",
+        action="store_true",
+        help="Show a single live progress line per command instead of its full output.",
+    )
+    parser_resume.set_defaults(func=handle_resume)
+
+    parser_sync = subparsers.add_parser(
+        "sync",
+        help="Bring an existing project's dependencies up to date, skipping whatever hasn't changed.",
+        description="Re-installs backend and/or frontend dependencies only if requirements.txt, package.json, "
+                    "the lockfile or the interpreter changed since the last successful install."
+    )
+    parser_sync.add_argument(
+        "directory",
+        nargs="?",
+        default=".",
+        help="Project directory (default: current directory).",
+    )
+    sync_side_group = parser_sync.add_mutually_exclusive_group()
+    sync_side_group.add_argument(
+        "--backend-only",
+        action="store_true",
+        help="Only sync Python dependencies.",
+    )
+    sync_side_group.add_argument(
+        "--frontend-only",
+        action="store_true",
+        help="Only sync Node.js dependencies.",
+    )
+    parser_sync.add_argument(
+        "--force",
+        action="store_true",
+        help="Install even if nothing changed.",
+    )
+    parser_sync.add_argument(
+        "--py-installer",
+        choices=sorted(PYTHON_INSTALLERS) + ["auto"],
+        default="auto",
+        help="Tool used to install Python packages. 'auto' uses uv when available, otherwise pip (default: auto).",
+    )
+    parser_sync.add_argument(
+        "--offline",
+        action="store_true",
+        help="Install Node.js packages from the shared pnpm store only.",
+    )
+    parser_sync.add_argument(
+        "--no-shared-store",
+        action="store_true",
+        help="Let pnpm use its own default store instead of reactango's shared store.",
+    )
+    parser_sync.set_defaults(func=handle_sync)
+
+    parser_batch = subparsers.add_parser(
+        "create-batch",
+        help="Create many projects at once from a JSON or TOML manifest.",
+        description="Creates every project listed in a manifest, several at a time, sharing one template fetch and the dependency caches."
+    )
+    parser_batch.add_argument(
+        "manifest",
+        help="Path to a .json or .toml manifest with a 'projects' list and optional 'defaults'.",
+    )
+    parser_batch.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Number of projects to create at the same time (default: %(default)s).",
+    )
+    parser_batch.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory the projects are created in (default: current directory).",
+    )
+    parser_batch.add_argument(
+        "--template",
+        help="Git URL, local directory or tarball of the template, unless a project sets its own (default: the official ReactTangoTemplate).",
+        default=TEMPLATE_REPO_URL
+    )
+    parser_batch.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never contact the network: use the cached template and the shared pnpm store only.",
+    )
+    parser_batch.add_argument(
+        "--refresh-template",
+        action="store_true",
+        help="Fetch template updates even if the cached copy is still fresh.",
+    )
+    parser_batch.add_argument(
+        "--no-template-cache",
+        action="store_true",
+        help="Fetch the template directly from the remote for every project.",
+    )
+    parser_batch.add_argument(
+        "--no-venv-cache",
+        action="store_true",
+        help="Always build virtual environments from scratch instead of reusing cached ones.",
+    )
+    parser_batch.add_argument(
+        "--no-shared-store",
+        action="store_true",
+        help="Let pnpm use its own default store instead of reactango's shared store.",
+    )
+    parser_batch.add_argument(
+        "--dedupe-store",
+        metavar="PATH",
+        default=None,
+        help="Deduplicate every project against this content-addressed store once it is created (same filesystem).",
+    )
+    parser_batch.add_argument(
+        "--dedupe-mode",
+        choices=DEDUPE_MODES,
+        default="auto",
+        help="How files are shared with the dedupe store: 'reflink' (copy-on-write clones), 'hardlink' (read-only shared files) "
+             "or 'auto', which clones where the filesystem can and otherwise hardlinks only venv/ and node_modules/ (default: auto).",
+    )
+    parser_batch.set_defaults(func=handle_create_batch)
+
+    parser_warm = subparsers.add_parser(
+        "warm",
+        help="Prefetch the template and its frontend dependencies for offline use.",
+        description="Updates the cached template and fetches every package in its pnpm lockfile into the shared pnpm store."
+    )
+    parser_warm.add_argument(
+        "--template",
+        help="Git URL, local directory or tarball of the template (default: the official ReactTangoTemplate).",
+        default=TEMPLATE_REPO_URL
+    )
+    parser_warm.add_argument(
+        "--branch",
+        help="Branch, tag or commit of the template whose lockfile should be prefetched.",
+        default=None
+    )
+    parser_warm.add_argument(
+        "--refresh-template",
+        action="store_true",
+        help="Fetch template updates even if the cached copy is still fresh.",
+    )
+    parser_warm.set_defaults(func=handle_warm)
+
+    parser_doctor = subparsers.add_parser(
+        "doctor",
+        help="Check that git, Python, Node.js and pnpm are installed and recent enough.",
+        description="Probes every tool reactango runs, reports its path and version, and exits with status 1 if a required one is missing or too old."
+    )
+    parser_doctor.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON (no banner).",
+    )
+    parser_doctor.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-run every tool instead of using the cached versions.",
+    )
+    parser_doctor.set_defaults(func=handle_doctor)
+
+    parser_templates = subparsers.add_parser(
+        "templates",
+        help="List cached templates with their branches, tags and tree hashes, or refresh them.",
+        description="Reads the local template index, which is updated whenever a template is fetched, without contacting the network."
+    )
+    templates_subparsers = parser_templates.add_subparsers(dest="templates_command", title="Actions")
+    templates_subparsers.required = True
+    parser_templates_list = templates_subparsers.add_parser("list", help="List cached templates and their versions (no network).")
+    parser_templates_list.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the index as JSON (no banner).",
+    )
+    parser_templates_refresh = templates_subparsers.add_parser("refresh", help="Fetch cached templates that are older than the TTL.")
+    parser_templates_refresh.add_argument(
+        "urls",
+        nargs="*",
+        metavar="URL",
+        help="Templates to refresh (default: every cached template, or the official one if none is cached).",
+    )
+    parser_templates_refresh.add_argument(
+        "--force",
+        action="store_true",
+        help="Fetch even if a template was refreshed within the TTL.",
+    )
+    parser_templates.set_defaults(func=handle_templates)
+
+    parser_dedupe = subparsers.add_parser(
+        "dedupe",
+        help="Replace identical files across projects with links into a shared content-addressed store.",
+        description="Hashes every file under the given projects (skipping .git and .reactango) and links identical ones to a single "
+                    "copy in the store, then reports the bytes reclaimed."
+    )
+    parser_dedupe.add_argument(
+        "paths",
+        nargs="*",
+        metavar="PATH",
+        help="Project directories to deduplicate.",
+    )
+    parser_dedupe.add_argument(
+        "--store",
+        required=True,
+        metavar="PATH",
+        help="The content-addressed store; it must be on the same filesystem as the projects.",
+    )
+    parser_dedupe.add_argument(
+        "--mode",
+        choices=DEDUPE_MODES,
+        default="auto",
+        help="'reflink' (copy-on-write clones), 'hardlink' (read-only shared files) or 'auto', which clones where the "
+             "filesystem can and otherwise hardlinks only venv/ and node_modules/ (default: auto).",
+    )
+    parser_dedupe.add_argument(
+        "--min-size",
+        default="1",
+        help="Leave files smaller than this alone, e.g. 4KB (default: 1 byte).",
+    )
+    parser_dedupe.add_argument(
+        "--prune",
+        action="store_true",
+        help="Afterwards, remove store objects that no project links to any more.",
+    )
+    parser_dedupe.set_defaults(func=handle_dedupe)
+
+    parser_venv_cache = subparsers.add_parser(
+        "venv-cache",
+        help="Inspect or trim the cache of prebuilt Python virtual environments.",
+        description="Manages the virtual environments cached by 'create', keyed on requirements.txt, interpreter and platform."
+    )
+    venv_cache_subparsers = parser_venv_cache.add_subparsers(dest="venv_cache_command", title="Actions")
+    venv_cache_subparsers.required = True
+    venv_cache_subparsers.add_parser("list", help="List cached virtual environments.")
+    parser_venv_prune = venv_cache_subparsers.add_parser("prune", help="Remove least recently used environments.")
+    parser_venv_prune.add_argument(
+        "--max-size",
+        default=VENV_CACHE_MAX_SIZE,
+        help=f"Shrink the cache to at most this size, e.g. 500MB or 2GB (default: {VENV_CACHE_MAX_SIZE}).",
+    )
+    venv_cache_subparsers.add_parser("clear", help="Remove every cached environment.")
+    parser_venv_cache.set_defaults(func=handle_venv_cache)
+
     args = parser.parse_args()
+    if args.output == "ndjson":
+        try:
+            os.fstat(args.event_fd)
+        except OSError as e:
+            parser.error(f"--event-fd {args.event_fd} is not an open file descriptor: {e.strerror}")
+        enable_event_output(args.event_fd)
+        event_sink.emit("run.start", argv=sys.argv[1:], version=__version__)
+    # The banner comes after parsing so '--version' and '--help' stay instant.
+    elif not getattr(args, "json", False):
+        print_banner()
 
-    if hasattr(args, 'func'):
-        args.func(args)
-    else:
-        parser.print_help()
+    exit_code = 1
+    try:
+        if hasattr(args, 'func'):
+            args.func(args)
+        else:
+            parser.print_help()
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    finally:
+        if event_sink is not None:
+            event_sink.emit("run.exit", "info" if exit_code == 0 else "error", exit_code=exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file